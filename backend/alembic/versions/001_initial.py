@@ -29,7 +29,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('name')
     )
-    op.create_index(op.f('ix_ingredients_id'), 'ingredients', ['id'], unique=False)
 
     # Products table
     op.create_table(
@@ -43,7 +42,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('name')
     )
-    op.create_index(op.f('ix_products_id'), 'products', ['id'], unique=False)
 
     # Product ingredients junction table
     op.create_table(
@@ -57,7 +55,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('product_id', 'ingredient_id')
     )
-    op.create_index(op.f('ix_product_ingredients_id'), 'product_ingredients', ['id'], unique=False)
 
     # Expense categories table
     op.create_table(
@@ -71,7 +68,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['parent_id'], ['expense_categories.id'], ondelete='RESTRICT'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_expense_categories_id'), 'expense_categories', ['id'], unique=False)
 
     # Daily records table
     op.create_table(
@@ -86,7 +82,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('date')
     )
-    op.create_index(op.f('ix_daily_records_id'), 'daily_records', ['id'], unique=False)
 
     # Inventory snapshots table
     op.create_table(
@@ -103,7 +98,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('daily_record_id', 'ingredient_id', 'snapshot_type', name='uq_snapshot_per_day_ingredient_type')
     )
-    op.create_index(op.f('ix_inventory_snapshots_id'), 'inventory_snapshots', ['id'], unique=False)
 
     # Sales items table
     op.create_table(
@@ -119,7 +113,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['product_id'], ['products.id'], ondelete='RESTRICT'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_sales_items_id'), 'sales_items', ['id'], unique=False)
 
     # Transactions table
     op.create_table(
@@ -137,7 +130,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['daily_record_id'], ['daily_records.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_transactions_id'), 'transactions', ['id'], unique=False)
     op.create_index('idx_transactions_date', 'transactions', ['transaction_date'], unique=False)
     op.create_index('idx_transactions_type', 'transactions', ['type'], unique=False)
 
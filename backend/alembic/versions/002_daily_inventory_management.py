@@ -30,6 +30,9 @@ def upgrade() -> None:
     # STEP 1: Create new enum types
     # =========================================================================
 
+    # Create enum types once; the same objects (create_type=False) are reused
+    # in the column definitions below so no further CREATE TYPE is attempted
+
     # Create inventory_location enum
     inventory_location_enum = postgresql.ENUM('shop', 'storage', name='inventorylocation', create_type=False)
     inventory_location_enum.create(op.get_bind(), checkfirst=True)
@@ -50,14 +53,14 @@ def upgrade() -> None:
     op.add_column('ingredients', sa.Column('is_active', sa.Boolean(), server_default='true', nullable=False))
 
     # Set default unit_label based on unit_type
+    # (unittype has exactly these two values, so every row is matched)
     op.execute("""
-        UPDATE ingredients
-        SET unit_label = CASE
-            WHEN unit_type = 'weight' THEN 'kg'
-            WHEN unit_type = 'count' THEN 'szt'
-            ELSE 'szt'
-        END
+        UPDATE ingredients i
+        SET unit_label = m.label
+        FROM (VALUES ('weight', 'kg'), ('count', 'szt')) AS m(unit_type, label)
+        WHERE i.unit_type::text = m.unit_type
     """)
+    op.execute("ANALYZE ingredients")
 
     # Make unit_label NOT NULL after data migration
     op.alter_column('ingredients', 'unit_label', nullable=False, server_default='szt')
@@ -87,7 +90,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint('price_pln > 0', name='check_variant_price_positive')
     )
-    op.create_index(op.f('ix_product_variants_id'), 'product_variants', ['id'], unique=False)
     op.create_index('ix_product_variants_product_id', 'product_variants', ['product_id'], unique=False)
 
     # =========================================================================
@@ -153,11 +155,19 @@ def upgrade() -> None:
     # Add new columns
     op.add_column('inventory_snapshots', sa.Column(
         'location',
-        sa.Enum('shop', 'storage', name='inventorylocation'),
+        inventory_location_enum,
         server_default='shop',
         nullable=False
     ))
-    op.add_column('inventory_snapshots', sa.Column('quantity', sa.Numeric(precision=10, scale=3), nullable=True))
+    # quantity is added NOT NULL with a constant default: PostgreSQL stores the
+    # default in the catalog (no table rewrite), and the backfill below then
+    # touches every row exactly once with no separate SET NOT NULL scan
+    op.add_column('inventory_snapshots', sa.Column(
+        'quantity',
+        sa.Numeric(precision=10, scale=3),
+        server_default='0',
+        nullable=False
+    ))
 
     # Migrate data: use quantity_grams or quantity_count based on ingredient unit_type
     op.execute("""
@@ -171,8 +181,8 @@ def upgrade() -> None:
         WHERE inv.ingredient_id = i.id
     """)
 
-    # Make quantity NOT NULL
-    op.alter_column('inventory_snapshots', 'quantity', nullable=False)
+    # Drop the temporary default, the application always sets quantity
+    op.alter_column('inventory_snapshots', 'quantity', server_default=None)
 
     # Drop old unique constraint
     op.drop_constraint('uq_snapshot_per_day_ingredient_type', 'inventory_snapshots', type_='unique')
@@ -208,7 +218,6 @@ def upgrade() -> None:
         sa.CheckConstraint('quantity > 0', name='check_delivery_quantity_positive'),
         sa.CheckConstraint('price_pln >= 0', name='check_delivery_price_non_negative')
     )
-    op.create_index(op.f('ix_deliveries_id'), 'deliveries', ['id'], unique=False)
     op.create_index('ix_deliveries_daily_record_id', 'deliveries', ['daily_record_id'], unique=False)
 
     # Storage transfers table
@@ -225,7 +234,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint('quantity > 0', name='check_transfer_quantity_positive')
     )
-    op.create_index(op.f('ix_storage_transfers_id'), 'storage_transfers', ['id'], unique=False)
     op.create_index('ix_storage_transfers_daily_record_id', 'storage_transfers', ['daily_record_id'], unique=False)
 
     # Spoilages table
@@ -235,7 +243,7 @@ def upgrade() -> None:
         sa.Column('daily_record_id', sa.Integer(), nullable=False),
         sa.Column('ingredient_id', sa.Integer(), nullable=False),
         sa.Column('quantity', sa.Numeric(precision=10, scale=3), nullable=False),
-        sa.Column('reason', postgresql.ENUM('expired', 'over_prepared', 'contaminated', 'equipment_failure', 'other', name='spoilagereason', create_type=False), nullable=False),
+        sa.Column('reason', spoilage_reason_enum, nullable=False),
         sa.Column('notes', sa.Text(), nullable=True),
         sa.Column('recorded_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
@@ -244,7 +252,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint('quantity > 0', name='check_spoilage_quantity_positive')
     )
-    op.create_index(op.f('ix_spoilages_id'), 'spoilages', ['id'], unique=False)
     op.create_index('ix_spoilages_daily_record_id', 'spoilages', ['daily_record_id'], unique=False)
 
     # Calculated sales table
@@ -262,7 +269,6 @@ def upgrade() -> None:
         sa.CheckConstraint('quantity_sold >= 0', name='check_calc_sale_quantity_non_negative'),
         sa.CheckConstraint('revenue_pln >= 0', name='check_calc_sale_revenue_non_negative')
     )
-    op.create_index(op.f('ix_calculated_sales_id'), 'calculated_sales', ['id'], unique=False)
     op.create_index('ix_calculated_sales_daily_record_id', 'calculated_sales', ['daily_record_id'], unique=False)
 
     # Storage inventory table
@@ -278,7 +284,6 @@ def upgrade() -> None:
         sa.UniqueConstraint('ingredient_id', name='uq_storage_inventory_ingredient'),
         sa.CheckConstraint('quantity >= 0', name='check_storage_quantity_non_negative')
     )
-    op.create_index(op.f('ix_storage_inventory_id'), 'storage_inventory', ['id'], unique=False)
 
     # =========================================================================
     # STEP 8: Drop price column from products (moved to variants)
@@ -286,6 +291,19 @@ def upgrade() -> None:
 
     op.drop_column('products', 'price')
 
+    # =========================================================================
+    # STEP 9: Vacuum and analyze the rewritten tables
+    # The backfills above leave a dead tuple behind for every updated row.
+    # Clean them up now, while the pages are still cached, instead of
+    # waiting for autovacuum. VACUUM cannot run inside a transaction.
+    # =========================================================================
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "VACUUM (ANALYZE) inventory_snapshots, product_ingredients, "
+            "product_variants, ingredients, products"
+        )
+
 
 def downgrade() -> None:
     # =========================================================================
@@ -377,7 +395,6 @@ def downgrade() -> None:
     # =========================================================================
 
     op.drop_index('ix_product_variants_product_id', table_name='product_variants')
-    op.drop_index(op.f('ix_product_variants_id'), table_name='product_variants')
     op.drop_table('product_variants')
 
     # =========================================================================
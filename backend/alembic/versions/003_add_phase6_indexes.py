@@ -9,6 +9,10 @@ This migration adds performance indexes identified during Phase 6 optimization:
 - Compound index on inventory_snapshots for (daily_record_id, snapshot_type) queries
 - Index on inventory_snapshots.daily_record_id
 - Index on inventory_snapshots.ingredient_id for foreign key queries
+
+Indexes are built with CREATE INDEX CONCURRENTLY so that applying this
+migration on a live database does not block writes to the tables.
+CONCURRENTLY cannot run inside a transaction, hence the autocommit block.
 """
 from typing import Sequence, Union
 from alembic import op
@@ -21,42 +25,48 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Index on daily_records.date for frequent filtering by date
-    # Note: unique constraint may already create implicit index, but explicit is clearer
-    op.create_index(
-        'ix_daily_records_date',
-        'daily_records',
-        ['date'],
-        unique=False
-    )
-
-    # Compound index on inventory_snapshots for efficient queries by record + type
-    op.create_index(
-        'ix_inventory_snapshots_record_type',
-        'inventory_snapshots',
-        ['daily_record_id', 'snapshot_type'],
-        unique=False
-    )
-
-    # Simple index on inventory_snapshots.daily_record_id
-    op.create_index(
-        'ix_inventory_snapshots_daily_record_id',
-        'inventory_snapshots',
-        ['daily_record_id'],
-        unique=False
-    )
-
-    # Index on inventory_snapshots.ingredient_id for foreign key queries
-    op.create_index(
-        'ix_inventory_snapshots_ingredient_id',
-        'inventory_snapshots',
-        ['ingredient_id'],
-        unique=False
-    )
+    with op.get_context().autocommit_block():
+        # Index on daily_records.date for frequent filtering by date
+        # Note: unique constraint may already create implicit index, but explicit is clearer
+        op.create_index(
+            'ix_daily_records_date',
+            'daily_records',
+            ['date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        # Compound index on inventory_snapshots for efficient queries by record + type
+        op.create_index(
+            'ix_inventory_snapshots_record_type',
+            'inventory_snapshots',
+            ['daily_record_id', 'snapshot_type'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        # Simple index on inventory_snapshots.daily_record_id
+        op.create_index(
+            'ix_inventory_snapshots_daily_record_id',
+            'inventory_snapshots',
+            ['daily_record_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+        # Index on inventory_snapshots.ingredient_id for foreign key queries
+        op.create_index(
+            'ix_inventory_snapshots_ingredient_id',
+            'inventory_snapshots',
+            ['ingredient_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_inventory_snapshots_ingredient_id', table_name='inventory_snapshots')
-    op.drop_index('ix_inventory_snapshots_daily_record_id', table_name='inventory_snapshots')
-    op.drop_index('ix_inventory_snapshots_record_type', table_name='inventory_snapshots')
-    op.drop_index('ix_daily_records_date', table_name='daily_records')
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_inventory_snapshots_ingredient_id', table_name='inventory_snapshots', postgresql_concurrently=True)
+        op.drop_index('ix_inventory_snapshots_daily_record_id', table_name='inventory_snapshots', postgresql_concurrently=True)
+        op.drop_index('ix_inventory_snapshots_record_type', table_name='inventory_snapshots', postgresql_concurrently=True)
+        op.drop_index('ix_daily_records_date', table_name='daily_records', postgresql_concurrently=True)
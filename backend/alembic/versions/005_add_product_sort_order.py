@@ -17,13 +17,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Add sort_order column with default 0
+    # (constant default: PostgreSQL 11+ records it in the catalog without a
+    # table rewrite, so the UPDATE below is the only pass over the heap)
     op.add_column('products', sa.Column('sort_order', sa.Integer(), nullable=False, server_default='0'))
 
     # Set initial sort_order based on id to preserve current order
     op.execute("UPDATE products SET sort_order = id")
 
-    # Create index for efficient sorting
-    op.create_index('idx_products_sort_order', 'products', ['sort_order'])
+    # Create index for efficient sorting, without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_products_sort_order',
+            'products',
+            ['sort_order'],
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
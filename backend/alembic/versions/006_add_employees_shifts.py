@@ -21,17 +21,19 @@ down_revision: Union[str, None] = '005'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Single definition of the wage period enum (created once in STEP 1)
+WAGE_PERIOD_TYPE = postgresql.ENUM(
+    'daily', 'weekly', 'biweekly', 'monthly',
+    name='wageperiodtype',
+    create_type=False
+)
+
 
 def upgrade() -> None:
     # =========================================================================
     # STEP 1: Create wage_period_type enum
     # =========================================================================
-    wage_period_type_enum = postgresql.ENUM(
-        'daily', 'weekly', 'biweekly', 'monthly',
-        name='wageperiodtype',
-        create_type=False
-    )
-    wage_period_type_enum.create(op.get_bind(), checkfirst=True)
+    WAGE_PERIOD_TYPE.create(op.get_bind(), checkfirst=True)
 
     # =========================================================================
     # STEP 2: Create positions table
@@ -46,7 +48,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('name', name='uq_positions_name')
     )
-    op.create_index(op.f('ix_positions_id'), 'positions', ['id'], unique=False)
 
     # =========================================================================
     # STEP 3: Create employees table
@@ -63,7 +64,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['position_id'], ['positions.id'], name='fk_employees_position_id'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_employees_id'), 'employees', ['id'], unique=False)
     op.create_index('idx_employees_position', 'employees', ['position_id'], unique=False)
     op.create_index('idx_employees_active', 'employees', ['is_active'], unique=False)
 
@@ -85,33 +85,39 @@ def upgrade() -> None:
         sa.UniqueConstraint('daily_record_id', 'employee_id', name='unique_employee_per_day'),
         sa.CheckConstraint('end_time > start_time', name='valid_time_range')
     )
-    op.create_index(op.f('ix_shift_assignments_id'), 'shift_assignments', ['id'], unique=False)
     op.create_index('idx_shift_assignments_daily_record', 'shift_assignments', ['daily_record_id'], unique=False)
     op.create_index('idx_shift_assignments_employee', 'shift_assignments', ['employee_id'], unique=False)
 
     # =========================================================================
     # STEP 5: Add wage-specific columns to transactions table
     # =========================================================================
-    op.add_column('transactions', sa.Column('employee_id', sa.Integer(), nullable=True))
-    op.add_column('transactions', sa.Column(
-        'wage_period_type',
-        postgresql.ENUM('daily', 'weekly', 'biweekly', 'monthly', name='wageperiodtype', create_type=False),
-        nullable=True
-    ))
-    op.add_column('transactions', sa.Column('wage_period_start', sa.Date(), nullable=True))
-    op.add_column('transactions', sa.Column('wage_period_end', sa.Date(), nullable=True))
-
-    # Add FK constraint for employee_id
-    op.create_foreign_key(
-        'fk_transactions_employee_id',
-        'transactions',
-        'employees',
-        ['employee_id'],
-        ['id']
-    )
-
-    # Add index for employee_id
-    op.create_index('idx_transactions_employee', 'transactions', ['employee_id'], unique=False)
+    # All four columns and the FK are added in a single ALTER TABLE so the
+    # ACCESS EXCLUSIVE lock on transactions is taken once (new nullable
+    # columns need no table rewrite). The FK is added NOT VALID so no scan
+    # happens under that lock; it is validated below.
+    op.execute("""
+        ALTER TABLE transactions
+            ADD COLUMN employee_id INTEGER,
+            ADD COLUMN wage_period_type wageperiodtype,
+            ADD COLUMN wage_period_start DATE,
+            ADD COLUMN wage_period_end DATE,
+            ADD CONSTRAINT fk_transactions_employee_id
+                FOREIGN KEY (employee_id) REFERENCES employees (id) NOT VALID
+    """)
+
+    # Add index for employee_id and validate the FK
+    # transactions is an existing, populated table: build without blocking
+    # writes; VALIDATE CONSTRAINT only takes a SHARE UPDATE EXCLUSIVE lock
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE transactions VALIDATE CONSTRAINT fk_transactions_employee_id")
+        op.create_index(
+            'idx_transactions_employee',
+            'transactions',
+            ['employee_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -119,18 +125,20 @@ def downgrade() -> None:
     # STEP 1: Remove wage-specific columns from transactions
     # =========================================================================
     op.drop_index('idx_transactions_employee', table_name='transactions')
-    op.drop_constraint('fk_transactions_employee_id', 'transactions', type_='foreignkey')
-    op.drop_column('transactions', 'wage_period_end')
-    op.drop_column('transactions', 'wage_period_start')
-    op.drop_column('transactions', 'wage_period_type')
-    op.drop_column('transactions', 'employee_id')
+    op.execute("""
+        ALTER TABLE transactions
+            DROP CONSTRAINT fk_transactions_employee_id,
+            DROP COLUMN wage_period_end,
+            DROP COLUMN wage_period_start,
+            DROP COLUMN wage_period_type,
+            DROP COLUMN employee_id
+    """)
 
     # =========================================================================
     # STEP 2: Drop shift_assignments table
     # =========================================================================
     op.drop_index('idx_shift_assignments_employee', table_name='shift_assignments')
     op.drop_index('idx_shift_assignments_daily_record', table_name='shift_assignments')
-    op.drop_index(op.f('ix_shift_assignments_id'), table_name='shift_assignments')
     op.drop_table('shift_assignments')
 
     # =========================================================================
@@ -138,13 +146,11 @@ def downgrade() -> None:
     # =========================================================================
     op.drop_index('idx_employees_active', table_name='employees')
     op.drop_index('idx_employees_position', table_name='employees')
-    op.drop_index(op.f('ix_employees_id'), table_name='employees')
     op.drop_table('employees')
 
     # =========================================================================
     # STEP 4: Drop positions table
     # =========================================================================
-    op.drop_index(op.f('ix_positions_id'), table_name='positions')
     op.drop_table('positions')
 
     # =========================================================================
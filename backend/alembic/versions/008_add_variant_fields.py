@@ -23,12 +23,15 @@ def upgrade() -> None:
     op.add_column('product_variants', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True, server_default=sa.func.now()))
 
     # Set first variant of each product as default
+    # (DISTINCT ON picks the lowest id per product in one sorted scan instead
+    # of a correlated MIN(id) lookup per row)
     op.execute("""
-        UPDATE product_variants pv
+        UPDATE product_variants
         SET is_default = true
-        WHERE id = (
-            SELECT MIN(id) FROM product_variants pv2
-            WHERE pv2.product_id = pv.product_id
+        WHERE id IN (
+            SELECT DISTINCT ON (product_id) id
+            FROM product_variants
+            ORDER BY product_id, id
         )
     """)
 
@@ -30,12 +30,19 @@ def upgrade() -> None:
     op.add_column('deliveries', sa.Column('invoice_number', sa.String(100), nullable=True))
     op.add_column('deliveries', sa.Column('notes', sa.Text(), nullable=True))
     op.add_column('deliveries', sa.Column('total_cost_pln', sa.Numeric(10, 2), nullable=True))
-    op.add_column('deliveries', sa.Column(
-        'transaction_id',
-        sa.Integer(),
-        sa.ForeignKey('transactions.id', ondelete='SET NULL'),
-        nullable=True
-    ))
+    op.add_column('deliveries', sa.Column('transaction_id', sa.Integer(), nullable=True))
+
+    # FK added NOT VALID (no scan of deliveries under the ALTER lock),
+    # validated at the end of the migration
+    op.create_foreign_key(
+        'deliveries_transaction_id_fkey',
+        'deliveries',
+        'transactions',
+        ['transaction_id'],
+        ['id'],
+        ondelete='SET NULL',
+        postgresql_not_valid=True
+    )
 
     # =========================================================================
     # STEP 2: Create delivery_items table
@@ -54,25 +61,28 @@ def upgrade() -> None:
         sa.CheckConstraint('quantity > 0', name='check_delivery_item_quantity_positive'),
         sa.CheckConstraint('cost_pln IS NULL OR cost_pln >= 0', name='check_delivery_item_cost_non_negative')
     )
-    op.create_index(op.f('ix_delivery_items_id'), 'delivery_items', ['id'], unique=False)
-    op.create_index('ix_delivery_items_delivery_id', 'delivery_items', ['delivery_id'], unique=False)
 
     # =========================================================================
     # STEP 3: Migrate existing data
     # For each old delivery, create a delivery_item and copy price_pln to total_cost_pln
     # =========================================================================
+    # Single pass over deliveries: the UPDATE fills total_cost_pln and
+    # RETURNING feeds the same rows into delivery_items
     op.execute("""
+        WITH migrated AS (
+            UPDATE deliveries
+            SET total_cost_pln = price_pln
+            RETURNING id, ingredient_id, quantity, price_pln, created_at
+        )
         INSERT INTO delivery_items (delivery_id, ingredient_id, quantity, cost_pln, created_at)
         SELECT id, ingredient_id, quantity, price_pln, created_at
-        FROM deliveries
+        FROM migrated
         WHERE ingredient_id IS NOT NULL
     """)
 
-    op.execute("""
-        UPDATE deliveries
-        SET total_cost_pln = price_pln
-        WHERE price_pln IS NOT NULL
-    """)
+    # The delivery_items index is built after the bulk INSERT above, so the
+    # load only maintains the primary key and the index is built in one pass
+    op.create_index('ix_delivery_items_delivery_id', 'delivery_items', ['delivery_id'], unique=False)
 
     # =========================================================================
     # STEP 4: Drop old columns and constraints from deliveries
@@ -99,8 +109,19 @@ def upgrade() -> None:
         'total_cost_pln >= 0'
     )
 
-    # Create index for transaction_id
-    op.create_index('ix_deliveries_transaction_id', 'deliveries', ['transaction_id'], unique=False)
+    # Create index for transaction_id and validate the FK
+    # deliveries is an existing, populated table: build without blocking
+    # writes; VALIDATE CONSTRAINT only takes a SHARE UPDATE EXCLUSIVE lock
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE deliveries VALIDATE CONSTRAINT deliveries_transaction_id_fkey")
+        op.create_index(
+            'ix_deliveries_transaction_id',
+            'deliveries',
+            ['transaction_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -151,7 +172,6 @@ def downgrade() -> None:
 
     # Drop delivery_items table
     op.drop_index('ix_delivery_items_delivery_id', 'delivery_items')
-    op.drop_index(op.f('ix_delivery_items_id'), 'delivery_items')
     op.drop_table('delivery_items')
 
     # =========================================================================
@@ -52,10 +52,9 @@ def upgrade() -> None:
         sa.CheckConstraint('remaining_quantity >= 0', name='check_batch_remaining_quantity_non_negative'),
         sa.CheckConstraint("location IN ('storage', 'shop')", name='check_batch_location_valid')
     )
-    op.create_index(op.f('ix_ingredient_batches_id'), 'ingredient_batches', ['id'], unique=False)
     op.create_index('ix_ingredient_batches_ingredient_id', 'ingredient_batches', ['ingredient_id'], unique=False)
     op.create_index('ix_ingredient_batches_expiry_date', 'ingredient_batches', ['expiry_date'], unique=False)
-    op.create_index('ix_ingredient_batches_batch_number', 'ingredient_batches', ['batch_number'], unique=False)
+    # batch_number lookups use the unique index behind uq_ingredient_batches_batch_number
 
     # =========================================================================
     # STEP 3: Create batch_deductions table (audit trail)
@@ -76,20 +75,37 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint('quantity > 0', name='check_batch_deduction_quantity_positive')
     )
-    op.create_index(op.f('ix_batch_deductions_id'), 'batch_deductions', ['id'], unique=False)
     op.create_index('ix_batch_deductions_batch_id', 'batch_deductions', ['batch_id'], unique=False)
     op.create_index('ix_batch_deductions_daily_record_id', 'batch_deductions', ['daily_record_id'], unique=False)
 
     # =========================================================================
     # STEP 4: Add batch_id FK to spoilages
     # =========================================================================
-    op.add_column('spoilages', sa.Column(
-        'batch_id',
-        sa.Integer(),
-        sa.ForeignKey('ingredient_batches.id', ondelete='SET NULL'),
-        nullable=True
-    ))
-    op.create_index('ix_spoilages_batch_id', 'spoilages', ['batch_id'], unique=False)
+    op.add_column('spoilages', sa.Column('batch_id', sa.Integer(), nullable=True))
+
+    # FK added NOT VALID (no scan of spoilages under the ALTER lock)
+    op.create_foreign_key(
+        'spoilages_batch_id_fkey',
+        'spoilages',
+        'ingredient_batches',
+        ['batch_id'],
+        ['id'],
+        ondelete='SET NULL',
+        postgresql_not_valid=True
+    )
+
+    # spoilages is an existing, populated table: validate the FK and build
+    # the index without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE spoilages VALIDATE CONSTRAINT spoilages_batch_id_fkey")
+        op.create_index(
+            'ix_spoilages_batch_id',
+            'spoilages',
+            ['batch_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -105,16 +121,13 @@ def downgrade() -> None:
     # =========================================================================
     op.drop_index('ix_batch_deductions_daily_record_id', 'batch_deductions')
     op.drop_index('ix_batch_deductions_batch_id', 'batch_deductions')
-    op.drop_index(op.f('ix_batch_deductions_id'), 'batch_deductions')
     op.drop_table('batch_deductions')
 
     # =========================================================================
     # STEP 3: Drop ingredient_batches table
     # =========================================================================
-    op.drop_index('ix_ingredient_batches_batch_number', 'ingredient_batches')
     op.drop_index('ix_ingredient_batches_expiry_date', 'ingredient_batches')
     op.drop_index('ix_ingredient_batches_ingredient_id', 'ingredient_batches')
-    op.drop_index(op.f('ix_ingredient_batches_id'), 'ingredient_batches')
     op.drop_table('ingredient_batches')
 
     # =========================================================================
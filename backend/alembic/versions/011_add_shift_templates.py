@@ -43,7 +43,6 @@ def upgrade() -> None:
         sa.CheckConstraint('day_of_week >= 0 AND day_of_week <= 6', name='valid_day_of_week'),
         sa.CheckConstraint('end_time > start_time', name='template_valid_time_range'),
     )
-    op.create_index(op.f('ix_shift_templates_id'), 'shift_templates', ['id'], unique=False)
     op.create_index('idx_shift_templates_employee', 'shift_templates', ['employee_id'], unique=False)
     op.create_index('idx_shift_templates_day', 'shift_templates', ['day_of_week'], unique=False)
 
@@ -72,7 +71,6 @@ def upgrade() -> None:
             name='override_valid_times'
         ),
     )
-    op.create_index(op.f('ix_shift_schedule_overrides_id'), 'shift_schedule_overrides', ['id'], unique=False)
     op.create_index('idx_schedule_overrides_employee', 'shift_schedule_overrides', ['employee_id'], unique=False)
     op.create_index('idx_schedule_overrides_date', 'shift_schedule_overrides', ['date'], unique=False)
 
@@ -83,7 +81,6 @@ def downgrade() -> None:
     # =========================================================================
     op.drop_index('idx_schedule_overrides_date', table_name='shift_schedule_overrides')
     op.drop_index('idx_schedule_overrides_employee', table_name='shift_schedule_overrides')
-    op.drop_index(op.f('ix_shift_schedule_overrides_id'), table_name='shift_schedule_overrides')
     op.drop_table('shift_schedule_overrides')
 
     # =========================================================================
@@ -91,5 +88,4 @@ def downgrade() -> None:
     # =========================================================================
     op.drop_index('idx_shift_templates_day', table_name='shift_templates')
     op.drop_index('idx_shift_templates_employee', table_name='shift_templates')
-    op.drop_index(op.f('ix_shift_templates_id'), table_name='shift_templates')
     op.drop_table('shift_templates')
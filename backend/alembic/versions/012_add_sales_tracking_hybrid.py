@@ -33,7 +33,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('name', name='uq_product_categories_name'),
     )
-    op.create_index(op.f('ix_product_categories_id'), 'product_categories', ['id'], unique=False)
 
     # =========================================================================
     # STEP 2: Create recorded_sales table
@@ -73,7 +72,6 @@ def upgrade() -> None:
             name='check_recorded_sales_void_reason_valid'
         ),
     )
-    op.create_index(op.f('ix_recorded_sales_id'), 'recorded_sales', ['id'], unique=False)
     op.create_index('idx_recorded_sales_daily_record', 'recorded_sales', ['daily_record_id'], unique=False)
     op.create_index('idx_recorded_sales_variant', 'recorded_sales', ['product_variant_id'], unique=False)
     op.create_index('idx_recorded_sales_recorded_at', 'recorded_sales', ['recorded_at'], unique=False)
@@ -91,78 +89,82 @@ def upgrade() -> None:
         ['category_id'], ['id'],
         ondelete='SET NULL'
     )
-    op.create_index('idx_products_category', 'products', ['category_id'], unique=False)
 
     # =========================================================================
     # STEP 4: Add revenue tracking columns to daily_records table
     # =========================================================================
-    op.add_column(
-        'daily_records',
-        sa.Column('recorded_revenue_pln', sa.Numeric(10, 2), nullable=True)
-    )
-    op.add_column(
-        'daily_records',
-        sa.Column('calculated_revenue_pln', sa.Numeric(10, 2), nullable=True)
-    )
-    op.add_column(
-        'daily_records',
-        sa.Column('revenue_discrepancy_pln', sa.Numeric(10, 2), nullable=True)
-    )
-    op.add_column(
-        'daily_records',
-        sa.Column('revenue_source', sa.String(20), nullable=True, server_default='calculated')
-    )
-    op.create_check_constraint(
-        'check_daily_records_revenue_source_valid',
-        'daily_records',
-        "revenue_source IN ('recorded', 'calculated', 'hybrid')"
-    )
+    # One ALTER TABLE so the ACCESS EXCLUSIVE lock is taken once
+    op.execute("""
+        ALTER TABLE daily_records
+            ADD COLUMN recorded_revenue_pln NUMERIC(10, 2),
+            ADD COLUMN calculated_revenue_pln NUMERIC(10, 2),
+            ADD COLUMN revenue_discrepancy_pln NUMERIC(10, 2),
+            ADD COLUMN revenue_source VARCHAR(20) DEFAULT 'calculated',
+            ADD CONSTRAINT check_daily_records_revenue_source_valid
+                CHECK (revenue_source IN ('recorded', 'calculated', 'hybrid'))
+    """)
 
     # =========================================================================
     # STEP 5: Seed product_categories with default values
     # =========================================================================
-    op.execute("""
-        INSERT INTO product_categories (name, sort_order) VALUES
-        ('Kebaby', 1),
-        ('Zapiekanki', 2),
-        ('Hot-Dogi', 3),
-        ('Frytki', 4),
-        ('Napoje', 5)
-    """)
-
+    product_categories = sa.table(
+        'product_categories',
+        sa.column('name', sa.String),
+        sa.column('sort_order', sa.Integer),
+    )
+    op.bulk_insert(product_categories, [
+        {'name': 'Kebaby', 'sort_order': 1},
+        {'name': 'Zapiekanki', 'sort_order': 2},
+        {'name': 'Hot-Dogi', 'sort_order': 3},
+        {'name': 'Frytki', 'sort_order': 4},
+        {'name': 'Napoje', 'sort_order': 5},
+    ])
 
-def downgrade() -> None:
     # =========================================================================
-    # STEP 1: Remove check constraint from daily_records
-    # =========================================================================
-    op.drop_constraint('check_daily_records_revenue_source_valid', 'daily_records', type_='check')
+    # STEP 6: Index products.category_id
+    # products is an existing, populated table: build without blocking
+    # writes (recorded_sales is created empty above, so its indexes are not)
+    # =========================================================================
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_products_category',
+            'products',
+            ['category_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
 
+def downgrade() -> None:
     # =========================================================================
-    # STEP 2: Remove revenue tracking columns from daily_records
+    # STEP 1: Remove revenue tracking columns and check from daily_records
     # =========================================================================
-    op.drop_column('daily_records', 'revenue_source')
-    op.drop_column('daily_records', 'revenue_discrepancy_pln')
-    op.drop_column('daily_records', 'calculated_revenue_pln')
-    op.drop_column('daily_records', 'recorded_revenue_pln')
+    op.execute("""
+        ALTER TABLE daily_records
+            DROP CONSTRAINT check_daily_records_revenue_source_valid,
+            DROP COLUMN revenue_source,
+            DROP COLUMN revenue_discrepancy_pln,
+            DROP COLUMN calculated_revenue_pln,
+            DROP COLUMN recorded_revenue_pln
+    """)
 
     # =========================================================================
-    # STEP 3: Remove category_id from products table
+    # STEP 2: Remove category_id from products table
     # =========================================================================
     op.drop_index('idx_products_category', table_name='products')
     op.drop_constraint('fk_products_category_id', 'products', type_='foreignkey')
     op.drop_column('products', 'category_id')
 
     # =========================================================================
-    # STEP 4: Drop recorded_sales table
+    # STEP 3: Drop recorded_sales table
     # =========================================================================
     op.drop_index('idx_recorded_sales_recorded_at', table_name='recorded_sales')
     op.drop_index('idx_recorded_sales_variant', table_name='recorded_sales')
     op.drop_index('idx_recorded_sales_daily_record', table_name='recorded_sales')
-    op.drop_index(op.f('ix_recorded_sales_id'), table_name='recorded_sales')
     op.drop_table('recorded_sales')
 
     # =========================================================================
-    # STEP 5: Drop product_categories table
+    # STEP 4: Drop product_categories table
     # =========================================================================
-    op.drop_index(op.f('ix_product_categories_id'), table_name='product_categories')
     op.drop_table('product_categories')
@@ -26,6 +26,8 @@ def upgrade() -> None:
     # =========================================================================
 
     # Add column with default value
+    # (constant default: PostgreSQL 11+ records it in the catalog, so the
+    # NOT NULL column is added without rewriting or backfilling deliveries)
     op.add_column(
         'deliveries',
         sa.Column(
@@ -0,0 +1,50 @@
+"""Drop redundant primary key indexes
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16
+
+Migrations 001 and 002 created an explicit ix_<table>_id index next to every
+primary key. PostgreSQL already backs each primary key with a unique btree,
+so these indexes only add write amplification and occupy shared buffers.
+
+Fresh databases no longer create them; this migration removes them from
+existing deployments. IF EXISTS keeps it safe on both.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables from migrations 001 and 002 that received an ix_<table>_id index
+PK_INDEXED_TABLES = [
+    'ingredients',
+    'products',
+    'product_ingredients',
+    'expense_categories',
+    'daily_records',
+    'inventory_snapshots',
+    'sales_items',
+    'transactions',
+    'product_variants',
+    'deliveries',
+    'storage_transfers',
+    'spoilages',
+    'calculated_sales',
+    'storage_inventory',
+]
+
+
+def upgrade() -> None:
+    for table in PK_INDEXED_TABLES:
+        op.drop_index(f'ix_{table}_id', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table in PK_INDEXED_TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False, if_not_exists=True)
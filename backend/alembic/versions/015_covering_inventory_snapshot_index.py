@@ -0,0 +1,88 @@
+"""Make inventory snapshot record/type index covering
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16
+
+Opening/closing stock is always read as "all snapshots of daily record X with
+snapshot type Y" and only needs ingredient_id, location and quantity. This
+migration:
+- Rebuilds ix_inventory_snapshots_record_type with
+  INCLUDE (ingredient_id, quantity, location) so those reads can be served by
+  an index-only scan
+- Drops ix_inventory_snapshots_daily_record_id, which is a leading prefix of
+  the compound index and therefore redundant
+- Sets fillfactor=90 on inventory_snapshots so quantity corrections can stay
+  HOT updates
+
+Indexes are built/dropped CONCURRENTLY to avoid blocking writes.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE inventory_snapshots SET (fillfactor = 90)")
+
+    with op.get_context().autocommit_block():
+        # Build the covering index under a temporary name first so the
+        # old index keeps serving queries until the new one is ready
+        op.create_index(
+            'ix_inventory_snapshots_record_type_new',
+            'inventory_snapshots',
+            ['daily_record_id', 'snapshot_type'],
+            unique=False,
+            postgresql_include=['ingredient_id', 'quantity', 'location'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_inventory_snapshots_record_type',
+            table_name='inventory_snapshots',
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_inventory_snapshots_daily_record_id',
+            table_name='inventory_snapshots',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    op.execute(
+        "ALTER INDEX ix_inventory_snapshots_record_type_new "
+        "RENAME TO ix_inventory_snapshots_record_type"
+    )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_inventory_snapshots_daily_record_id',
+            'inventory_snapshots',
+            ['daily_record_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_inventory_snapshots_record_type_old',
+            'inventory_snapshots',
+            ['daily_record_id', 'snapshot_type'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_inventory_snapshots_record_type',
+            table_name='inventory_snapshots',
+            postgresql_concurrently=True,
+        )
+
+    op.execute(
+        "ALTER INDEX ix_inventory_snapshots_record_type_old "
+        "RENAME TO ix_inventory_snapshots_record_type"
+    )
+    op.execute("ALTER TABLE inventory_snapshots RESET (fillfactor)")
@@ -0,0 +1,58 @@
+"""Add partial indexes for soft-delete filters
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16
+
+Almost every list query filters on is_active = true. Partial indexes only
+store the active rows, so they stay small while serving those queries:
+- ix_ingredients_active: active ingredient lists (inventory, day wizard)
+- ix_products_active_sort_order: menu listing (active products ordered by sort_order)
+- ix_product_variants_active: active variants of a product / variant counts
+
+Indexes are built CONCURRENTLY to avoid blocking writes.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredients_active',
+            'ingredients',
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_products_active_sort_order',
+            'products',
+            ['sort_order'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_product_variants_active',
+            'product_variants',
+            ['product_id'],
+            unique=False,
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_product_variants_active', table_name='product_variants', postgresql_concurrently=True)
+        op.drop_index('ix_products_active_sort_order', table_name='products', postgresql_concurrently=True)
+        op.drop_index('ix_ingredients_active', table_name='ingredients', postgresql_concurrently=True)
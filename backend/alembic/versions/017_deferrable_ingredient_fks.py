@@ -0,0 +1,49 @@
+"""Make foreign keys to ingredients deferrable
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-16
+
+All foreign keys referencing ingredients.id become
+DEFERRABLE INITIALLY IMMEDIATE. Behaviour is unchanged by default (the check
+still runs per statement), but bulk imports can now run
+SET CONSTRAINTS ALL DEFERRED and have the checks done once at commit.
+
+ALTER CONSTRAINT only updates the catalog, no table is rewritten or rescanned.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables with an ingredient_id foreign key (PostgreSQL default constraint names)
+INGREDIENT_FK_TABLES = [
+    'product_ingredients',
+    'inventory_snapshots',
+    'storage_transfers',
+    'spoilages',
+    'storage_inventory',
+    'delivery_items',
+    'ingredient_batches',
+]
+
+
+def upgrade() -> None:
+    for table in INGREDIENT_FK_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER CONSTRAINT {table}_ingredient_id_fkey "
+            "DEFERRABLE INITIALLY IMMEDIATE"
+        )
+
+
+def downgrade() -> None:
+    for table in INGREDIENT_FK_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ALTER CONSTRAINT {table}_ingredient_id_fkey "
+            "NOT DEFERRABLE"
+        )
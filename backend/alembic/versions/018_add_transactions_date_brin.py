@@ -0,0 +1,40 @@
+"""Add BRIN index on transactions.transaction_date
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-16
+
+Transactions are inserted roughly in date order and the dashboard/reports
+read them by date range. A BRIN index summarises block ranges, so it stays
+tiny while still pruning most of the table for range scans.
+
+The existing idx_transactions_date btree is kept for exact-date lookups and
+for backdated entries, which BRIN handles less precisely. daily_records.date
+keeps its unique btree (required by the unique constraint).
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'brin_transactions_date',
+            'transactions',
+            ['transaction_date'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('brin_transactions_date', table_name='transactions', postgresql_concurrently=True)
@@ -0,0 +1,48 @@
+"""Add (ingredient_id, daily_record_id) indexes on storage_transfers and spoilages
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16
+
+Per-ingredient usage calculations sum transfers and spoilage for one
+ingredient on one day, and reports do the same across a range of days.
+A compound index with ingredient_id first serves both the two-column filter
+and ingredient-only lookups (including the RESTRICT check when an
+ingredient is deleted).
+
+The single-column daily_record_id indexes are kept: day views list all
+transfers/spoilage of a record and ON DELETE CASCADE from daily_records
+looks rows up by daily_record_id alone.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_storage_transfers_ingredient_daily',
+            'storage_transfers',
+            ['ingredient_id', 'daily_record_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_spoilages_ingredient_daily',
+            'spoilages',
+            ['ingredient_id', 'daily_record_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_spoilages_ingredient_daily', table_name='spoilages', postgresql_concurrently=True)
+        op.drop_index('ix_storage_transfers_ingredient_daily', table_name='storage_transfers', postgresql_concurrently=True)
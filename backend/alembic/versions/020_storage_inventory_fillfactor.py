@@ -0,0 +1,30 @@
+"""Set fillfactor=70 on storage_inventory
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16
+
+storage_inventory.quantity is updated on every delivery, transfer and
+spoilage while its indexed column (ingredient_id) never changes. Leaving
+30% free space per heap page lets PostgreSQL perform these as HOT updates,
+so no index entries are written and less vacuum work is needed.
+
+The setting applies to pages written from now on; the table holds one row
+per ingredient, so it is repacked naturally by regular updates.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE storage_inventory SET (fillfactor = 70)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE storage_inventory RESET (fillfactor)")
@@ -0,0 +1,33 @@
+"""Drop duplicate index on ingredient_batches.batch_number
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-16
+
+Migration 010 created ix_ingredient_batches_batch_number next to the
+uq_ingredient_batches_batch_number unique constraint, which already has its
+own unique btree on the same column. The plain index only doubled the index
+writes on every batch insert.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '021'
+down_revision: Union[str, None] = '020'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_ingredient_batches_batch_number', table_name='ingredient_batches', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_ingredient_batches_batch_number',
+        'ingredient_batches',
+        ['batch_number'],
+        unique=False,
+        if_not_exists=True,
+    )
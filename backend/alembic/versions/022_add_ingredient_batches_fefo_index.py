@@ -0,0 +1,43 @@
+"""Add partial FEFO index on ingredient_batches
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-16
+
+Stock level and batch views look up the active batches of one ingredient
+(is_active AND remaining_quantity > 0) to count them and find the nearest
+expiry date. A partial (ingredient_id, expiry_date) index covers exactly that
+shape: it only holds batches with stock left, and MIN(expiry_date) per
+ingredient becomes a single index probe.
+
+ix_ingredient_batches_ingredient_id is kept for lookups that include
+depleted batches and for the RESTRICT check when an ingredient is deleted;
+ix_ingredient_batches_expiry_date is kept for the cross-ingredient expiry
+alerts.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '022'
+down_revision: Union[str, None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredient_batches_fefo',
+            'ingredient_batches',
+            ['ingredient_id', 'expiry_date'],
+            unique=False,
+            postgresql_where=sa.text('is_active AND remaining_quantity > 0'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ingredient_batches_fefo', table_name='ingredient_batches', postgresql_concurrently=True)
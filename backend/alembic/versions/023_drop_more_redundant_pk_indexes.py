@@ -0,0 +1,43 @@
+"""Drop redundant primary key indexes from migrations 006-012
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-10-16
+
+Same cleanup as migration 014, for the tables introduced in migrations
+006 through 012: each had an explicit ix_<table>_id index duplicating the
+unique btree PostgreSQL already maintains for the primary key.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+revision: str = '023'
+down_revision: Union[str, None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables from migrations 006-012 that received an ix_<table>_id index
+PK_INDEXED_TABLES = [
+    'positions',
+    'employees',
+    'shift_assignments',
+    'delivery_items',
+    'ingredient_batches',
+    'batch_deductions',
+    'shift_templates',
+    'shift_schedule_overrides',
+    'product_categories',
+    'recorded_sales',
+]
+
+
+def upgrade() -> None:
+    for table in PK_INDEXED_TABLES:
+        op.drop_index(f'ix_{table}_id', table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table in PK_INDEXED_TABLES:
+        op.create_index(f'ix_{table}_id', table, ['id'], unique=False, if_not_exists=True)
@@ -0,0 +1,40 @@
+"""Index recorded_sales.shift_assignment_id
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-10-16
+
+Migration 012 indexed every foreign key of recorded_sales except
+shift_assignment_id. PostgreSQL does not index referencing columns on its
+own, so per-shift sales lookups and the ON DELETE SET NULL check when a
+shift assignment is removed had to scan the whole table.
+
+Most sales are recorded without a shift, so the index is partial and only
+holds rows where shift_assignment_id IS NOT NULL.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '024'
+down_revision: Union[str, None] = '023'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_recorded_sales_shift_assignment',
+            'recorded_sales',
+            ['shift_assignment_id'],
+            unique=False,
+            postgresql_where=sa.text('shift_assignment_id IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_recorded_sales_shift_assignment', table_name='recorded_sales', postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Add covering partial index for non-voided recorded sales
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-16
+
+Day totals and reconciliation aggregate the non-voided sales of one daily
+record, grouped by product variant, and only read quantity and
+unit_price_pln. A partial (daily_record_id, product_variant_id) index over
+voided_at IS NULL with INCLUDE (quantity, unit_price_pln) lets those
+aggregations run as index-only scans.
+
+idx_recorded_sales_daily_record is kept for listings that include voided
+sales and for ON DELETE CASCADE from daily_records.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '025'
+down_revision: Union[str, None] = '024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_recorded_sales_active_by_day',
+            'recorded_sales',
+            ['daily_record_id', 'product_variant_id'],
+            unique=False,
+            postgresql_where=sa.text('voided_at IS NULL'),
+            postgresql_include=['quantity', 'unit_price_pln'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_recorded_sales_active_by_day', table_name='recorded_sales', postgresql_concurrently=True)
@@ -0,0 +1,58 @@
+"""Replace ingredient_batches expiry_date index with a partial one
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-16
+
+Expiry alerts read active batches with stock left whose expiry_date falls
+before a cutoff, ordered by expiry_date, across all ingredients. The full
+ix_ingredient_batches_expiry_date index also holds every depleted batch,
+which over time is most of the table. A partial index over
+is_active AND remaining_quantity > 0 serves the same range scan from only
+the rows that can raise an alert.
+
+No other query filters on expiry_date without the active/in-stock
+predicate, so the full index is dropped.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '026'
+down_revision: Union[str, None] = '025'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredient_batches_active_expiry',
+            'ingredient_batches',
+            ['expiry_date'],
+            unique=False,
+            postgresql_where=sa.text('is_active AND remaining_quantity > 0'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ingredient_batches_expiry_date',
+            table_name='ingredient_batches',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ingredient_batches_expiry_date',
+            'ingredient_batches',
+            ['expiry_date'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_ingredient_batches_active_expiry',
+            table_name='ingredient_batches',
+            postgresql_concurrently=True,
+        )
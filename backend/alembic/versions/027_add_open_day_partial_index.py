@@ -0,0 +1,47 @@
+"""Add partial index for the open day lookup
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-16
+
+The open day is looked up on most screens (status/open, day opening checks,
+previous unclosed day warning) with "status = 'open'", optionally with
+date < X ORDER BY date DESC. status has no index, so each lookup scans
+daily_records, which grows by one row per day and is almost entirely closed
+days. A partial index on date over open rows holds at most a handful of
+entries and serves both the plain lookup and the ordered range scan.
+
+The date ordering itself is already served by the unique index on date
+(scanned backwards for ORDER BY date DESC), so no separate DESC index is
+added.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '027'
+down_revision: Union[str, None] = '026'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_daily_records_open_date',
+            'daily_records',
+            ['date'],
+            unique=False,
+            postgresql_where=sa.text("status = 'open'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_daily_records_open_date',
+            table_name='daily_records',
+            postgresql_concurrently=True,
+        )
@@ -5,20 +5,23 @@ Endpoints for batch/expiry tracking:
 - GET /batches/expiry-alerts - Get expiry warnings
 - GET /batches/ingredient/{ingredient_id} - Get batches for ingredient (FIFO order)
 - GET /batches/ingredient/{ingredient_id}/summary - Get batch summary
+- POST /batches/ingredient/summaries - Get batch summaries for many ingredients
 - GET /batches/{batch_id} - Get single batch details
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.core.database import get_db
+from app.core.etag import json_response_with_etag
 from app.services import batch_service
 from app.schemas.batch import (
     BatchResponse,
     BatchListResponse,
     ExpiryAlertsListResponse,
     IngredientBatchSummary,
+    IngredientBatchSummariesRequest,
     EXPIRY_ALERT_DAYS,
 )
 
@@ -108,13 +111,14 @@ def get_batches_for_ingredient(
     """
 )
 def get_ingredient_batch_summary(
+    request: Request,
     ingredient_id: int,
     location: Optional[str] = Query(
         None,
         description="Filtruj po lokalizacji: 'storage' lub 'shop'"
     ),
     db: Session = Depends(get_db)
-) -> IngredientBatchSummary:
+):
     """Get batch summary for an ingredient."""
     summary, error = batch_service.get_ingredient_batch_summary(
         db,
@@ -123,7 +127,34 @@ def get_ingredient_batch_summary(
     )
     if error:
         raise HTTPException(status_code=404, detail=error)
-    return summary
+    return json_response_with_etag(request, summary.model_dump_json().encode())
+
+
+@router.post(
+    "/ingredient/summaries",
+    response_model=list[IngredientBatchSummary],
+    summary="Pobierz podsumowania partii wielu składników",
+    description="""
+    Zwraca podsumowania partii (jak `/ingredient/{ingredient_id}/summary`)
+    dla wielu składników w jednym zapytaniu, w kolejności podanych ID.
+
+    Przydatne do widoku stanu magazynowego zamiast osobnego zapytania
+    dla każdego składnika.
+    """
+)
+def get_ingredient_batch_summaries(
+    body: IngredientBatchSummariesRequest,
+    db: Session = Depends(get_db)
+) -> list[IngredientBatchSummary]:
+    """Get batch summaries for several ingredients."""
+    summaries, error = batch_service.get_ingredient_batch_summaries(
+        db,
+        ingredient_ids=body.ingredient_ids,
+        location=body.location.value if body.location else None
+    )
+    if error:
+        raise HTTPException(status_code=404, detail=error)
+    return summaries
 
 
 # -----------------------------------------------------------------------------
@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from app.api.deps import get_db
+from app.core.etag import json_response_with_etag
 from app.core.i18n import t
 from app.schemas.expense_category import (
     ExpenseCategoryCreate,
@@ -14,32 +16,44 @@ from app.services.category_service import CategoryNotFoundError, MaxDepthExceede
 
 router = APIRouter()
 
+_category_list_adapter = TypeAdapter(list[ExpenseCategoryResponse])
+_category_tree_adapter = TypeAdapter(list[ExpenseCategoryTree])
+_category_leaf_adapter = TypeAdapter(list[ExpenseCategoryLeafResponse])
+
 
 @router.get("", response_model=list[ExpenseCategoryResponse])
 def list_categories(
+    request: Request,
     active_only: bool = True,
     db: Session = Depends(get_db),
 ):
     """Pobierz liste kategorii wydatkow."""
-    return category_service.get_categories(db, active_only)
+    categories = _category_list_adapter.validate_python(
+        category_service.get_categories(db, active_only), from_attributes=True
+    )
+    return json_response_with_etag(request, _category_list_adapter.dump_json(categories))
 
 
 @router.get("/tree", response_model=list[ExpenseCategoryTree])
 def get_category_tree(
+    request: Request,
     active_only: bool = True,
     db: Session = Depends(get_db),
 ):
     """Pobierz drzewo kategorii wydatkow."""
-    return category_service.get_category_tree(db, active_only)
+    tree = category_service.get_category_tree(db, active_only)
+    return json_response_with_etag(request, _category_tree_adapter.dump_json(tree))
 
 
 @router.get("/leaves", response_model=list[ExpenseCategoryLeafResponse])
 def get_leaf_categories(
+    request: Request,
     active_only: bool = True,
     db: Session = Depends(get_db),
 ):
     """Pobierz tylko kategorie lisciowe (poziom 3) do przypisania do transakcji."""
-    return category_service.get_leaf_categories(db, active_only)
+    leaves = category_service.get_leaf_categories(db, active_only)
+    return json_response_with_etag(request, _category_leaf_adapter.dump_json(leaves))
 
 
 @router.post("", response_model=ExpenseCategoryResponse, status_code=status.HTTP_201_CREATED)
@@ -9,12 +9,17 @@ Provides endpoints for:
 - Day closing wizard operations
 """
 
-from decimal import Decimal
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+import re
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.api.deps import get_db
+from app.core.etag import json_response, json_response_with_etag
 from app.core.i18n import t
 from app.services import daily_operations_service
 from app.services.day_wizard_service import (
@@ -44,19 +49,29 @@ from app.schemas.day_wizard import (
     CompleteOpeningRequest,
     CompleteOpeningResponse,
     SuggestedShiftsResponse,
+    SalesPreviewRequest,
     SalesPreviewResponse,
 )
 from app.models.daily_record import DailyRecord, DayStatus
-from app.models.inventory_snapshot import InventorySnapshot
-from app.models.delivery import Delivery
-from app.models.storage_transfer import StorageTransfer
-from app.models.spoilage import Spoilage
 from app.models.transaction import Transaction
-from app.models.calculated_sale import CalculatedSale
 
 
 router = APIRouter()
 
+_daily_record_list_adapter = TypeAdapter(list[DailyRecordResponse])
+# The list only needs the response columns; plain rows skip ORM hydration
+_daily_record_list_columns = (
+    DailyRecord.id,
+    DailyRecord.date,
+    DailyRecord.status,
+    DailyRecord.opened_at,
+    DailyRecord.closed_at,
+    DailyRecord.notes,
+    DailyRecord.created_at,
+)
+# Sales preview query param key: closing_inventory[<ingredient_id>]
+_CLOSING_INVENTORY_PARAM = re.compile(r'closing_inventory\[(\d+)\]')
+
 
 # -----------------------------------------------------------------------------
 # List Daily Records
@@ -64,19 +79,37 @@ router = APIRouter()
 
 @router.get("/", response_model=list[DailyRecordResponse])
 def list_daily_records(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(30, ge=1, le=100),
+    cursor_date: Optional[date] = Query(None, description="Data ostatniego rekordu z poprzedniej strony"),
     db: Session = Depends(get_db),
 ):
     """
     Pobierz liste rekordow dziennych.
 
     Zwraca rekordy posortowane od najnowszych.
-    """
-    items = db.query(DailyRecord).order_by(
-        DailyRecord.date.desc()
-    ).offset(skip).limit(limit).all()
-    return items
+
+    Stronicowanie kursorem: przekaz `cursor_date` rowne dacie ostatniego
+    rekordu z poprzedniej strony, aby pobrac kolejna strone bez OFFSET
+    (zapytanie korzysta z unikalnego indeksu na `date`). Gdy strona jest
+    pelna, naglowek `Link` (rel="next") zawiera gotowy adres kolejnej strony.
+    """
+    query = db.query(*_daily_record_list_columns)
+    if cursor_date is not None:
+        query = query.filter(DailyRecord.date < cursor_date)
+    query = query.order_by(DailyRecord.date.desc())
+    if cursor_date is None:
+        query = query.offset(skip)
+
+    items = _daily_record_list_adapter.validate_python(query.limit(limit).all(), from_attributes=True)
+    response = json_response(_daily_record_list_adapter.dump_json(items))
+    if len(items) == limit:
+        next_url = request.url.remove_query_params("skip").include_query_params(
+            cursor_date=items[-1].date.isoformat()
+        )
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+    return response
 
 
 # -----------------------------------------------------------------------------
@@ -85,6 +118,7 @@ def list_daily_records(
 
 @router.get("/today", response_model=Optional[DailyRecordDetailResponse])
 def get_today_record(
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -96,7 +130,8 @@ def get_today_record(
     if not record:
         return None
 
-    return daily_operations_service.get_daily_record_detail(db, record.id)
+    detail = daily_operations_service.build_daily_record_detail(db, record)
+    return json_response_with_etag(request, detail.model_dump_json().encode())
 
 
 # -----------------------------------------------------------------------------
@@ -152,7 +187,9 @@ def get_recent_days(
 
     Zwraca uproszczone rekordy z liczba alertow.
     """
-    return daily_operations_service.get_recent_records(db, limit)
+    # The service already returns JSON-ready primitives, so jsonable_encoder
+    # has nothing to convert
+    return JSONResponse(daily_operations_service.get_recent_records(db, limit))
 
 
 # -----------------------------------------------------------------------------
@@ -161,6 +198,7 @@ def get_recent_days(
 
 @router.get("/status/open", response_model=Optional[DailyRecordDetailResponse])
 def get_open_day(
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -172,7 +210,8 @@ def get_open_day(
     if not record:
         return None
 
-    return daily_operations_service.get_daily_record_detail(db, record.id)
+    detail = daily_operations_service.build_daily_record_detail(db, record)
+    return json_response_with_etag(request, detail.model_dump_json().encode())
 
 
 # =============================================================================
@@ -184,6 +223,7 @@ def get_open_day(
 @router.get("/{record_id}/wizard-state", response_model=WizardStateResponse)
 def get_wizard_state(
     record_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -198,13 +238,15 @@ def get_wizard_state(
     service = DayWizardService(db)
 
     try:
-        return service.get_wizard_state(record_id)
+        state = service.get_wizard_state(record_id)
     except DailyRecordNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.record_not_found")
         )
 
+    return json_response_with_etag(request, state.model_dump_json().encode())
+
 
 @router.post("/{record_id}/complete-opening", response_model=CompleteOpeningResponse)
 def complete_opening(
@@ -264,14 +306,14 @@ def get_suggested_shifts(
     service = DayWizardService(db)
 
     try:
-        record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-        if not record:
+        record_date = db.query(DailyRecord.date).filter(DailyRecord.id == record_id).scalar()
+        if record_date is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=t("errors.record_not_found")
             )
 
-        shifts = service.get_suggested_shifts(record_id, record.date)
+        shifts = service.get_suggested_shifts(record_id, record_date)
         return SuggestedShiftsResponse(suggested_shifts=shifts)
     except DailyRecordNotFoundError:
         raise HTTPException(
@@ -301,27 +343,44 @@ def get_sales_preview(
     - summary: podsumowanie finansowe
     - warnings: ostrzezenia (np. rozbieznosci)
     """
-    import re
-
     # Parse closing_inventory from query params
     # Format: closing_inventory[1]=38.0 becomes {1: Decimal("38.0")}
     closing_inventory: dict[int, Decimal] = {}
 
     for key, value in request.query_params.items():
         # Match closing_inventory[id] pattern
-        match = re.match(r'closing_inventory\[(\d+)\]', key)
+        match = _CLOSING_INVENTORY_PARAM.fullmatch(key)
         if match:
-            ingredient_id = int(match.group(1))
             try:
-                closing_inventory[ingredient_id] = Decimal(str(value))
-            except (ValueError, TypeError):
+                closing_inventory[int(match.group(1))] = Decimal(value)
+            except InvalidOperation:
                 pass  # Skip invalid values
 
+    return _calculate_sales_preview(db, record_id, closing_inventory)
+
+
+@router.post("/{record_id}/sales-preview")
+def post_sales_preview(
+    record_id: int,
+    data: SalesPreviewRequest,
+    db: Session = Depends(get_db),
+):
+    """
+    Pobierz podglad sprzedazy na podstawie stanow zamkniecia (JSON).
+
+    Body: {"closing_inventory": {"<ingredient_id>": ilosc, ...}}
+
+    W odroznieniu od wariantu GET niepoprawne ilosci nie sa pomijane,
+    tylko zwracaja 422.
+    """
+    return _calculate_sales_preview(db, record_id, data.closing_inventory)
+
+
+def _calculate_sales_preview(db: Session, record_id: int, closing_inventory: dict[int, Decimal]):
     service = DayWizardService(db)
 
     try:
-        result = service.calculate_sales_preview(record_id, closing_inventory)
-        return result
+        return service.calculate_sales_preview(record_id, closing_inventory)
     except DailyRecordNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -444,6 +503,7 @@ def close_day(
 @router.get("/{record_id}", response_model=DailyRecordDetailResponse)
 def get_daily_record(
     record_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -461,7 +521,7 @@ def get_daily_record(
             detail=t("errors.record_not_found")
         )
 
-    return result
+    return json_response_with_etag(request, result.model_dump_json().encode())
 
 
 # -----------------------------------------------------------------------------
@@ -471,6 +531,7 @@ def get_daily_record(
 @router.get("/{record_id}/events", response_model=DayEventsSummary)
 def get_day_events(
     record_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -486,7 +547,7 @@ def get_day_events(
             detail=t("errors.record_not_found")
         )
 
-    return result
+    return json_response_with_etag(request, result.model_dump_json().encode())
 
 
 # -----------------------------------------------------------------------------
@@ -496,6 +557,7 @@ def get_day_events(
 @router.get("/{record_id}/summary", response_model=DaySummaryResponse)
 def get_daily_summary(
     record_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -514,7 +576,7 @@ def get_daily_summary(
             detail=t("errors.record_not_found")
         )
 
-    return result
+    return json_response_with_etag(request, result.model_dump_json().encode())
 
 
 # -----------------------------------------------------------------------------
@@ -551,7 +613,11 @@ def edit_closed_day(
 # Delete Daily Record (for testing)
 # -----------------------------------------------------------------------------
 
-@router.delete("/{record_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{record_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
 def delete_daily_record(
     record_id: int,
     db: Session = Depends(get_db),
@@ -566,21 +632,23 @@ def delete_daily_record(
     - Straty
     - Transakcje
     """
-    record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-
-    if not record:
+    # Transactions are only detached (ON DELETE SET NULL), so the day's own
+    # ones are deleted explicitly. Every other child table has ON DELETE
+    # CASCADE, so a bulk DELETE of the record removes them in the database
+    # without loading each relationship through the ORM first.
+    db.query(Transaction).filter(
+        Transaction.daily_record_id == record_id
+    ).delete(synchronize_session=False)
+    deleted = db.query(DailyRecord).filter(
+        DailyRecord.id == record_id
+    ).delete(synchronize_session=False)
+
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.record_not_found")
         )
 
-    # Delete all related records (cascading should handle most, but be explicit)
-    db.query(InventorySnapshot).filter(InventorySnapshot.daily_record_id == record_id).delete()
-    db.query(Delivery).filter(Delivery.daily_record_id == record_id).delete()
-    db.query(StorageTransfer).filter(StorageTransfer.daily_record_id == record_id).delete()
-    db.query(Spoilage).filter(Spoilage.daily_record_id == record_id).delete()
-    db.query(Transaction).filter(Transaction.daily_record_id == record_id).delete()
-    db.query(CalculatedSale).filter(CalculatedSale.daily_record_id == record_id).delete()
-
-    db.delete(record)
     db.commit()
+    daily_operations_service.clear_closed_day_alerts_cache()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
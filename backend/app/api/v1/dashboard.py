@@ -8,12 +8,21 @@ from app.schemas.dashboard import (
     ExpensesBreakdown,
     ProfitData,
     DiscrepancyWarning,
+    DashboardData,
 )
 from app.services import dashboard_service
 
 router = APIRouter()
 
 
+@router.get("/all", response_model=DashboardData)
+def get_dashboard_data(
+    db: Session = Depends(get_db),
+):
+    """Pobierz przeglad pulpitu i ostrzezenia z ostatnich 7 dni w jednym zapytaniu."""
+    return dashboard_service.get_dashboard_data(db)
+
+
 @router.get("/overview", response_model=DashboardOverview)
 def get_dashboard_overview(
     db: Session = Depends(get_db),
@@ -1,8 +1,9 @@
 from datetime import date
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.api.deps import get_db
+from app.core.etag import json_response
 from app.core.i18n import t
 from app.models.employee import Employee
 from app.schemas.employee import (
@@ -41,13 +42,9 @@ def list_employees(
     db: Session = Depends(get_db),
 ):
     """Pobierz liste pracownikow."""
-    employees = employee_service.get_employees(db, include_inactive)
-    total = employee_service.count_employees(db, include_inactive)
-
-    return EmployeeListResponse(
-        items=[_to_response(e) for e in employees],
-        total=total,
-    )
+    employees, total = employee_service.get_employees_with_total(db, include_inactive)
+    content = EmployeeListResponse(items=employees, total=total).model_dump_json()
+    return json_response(content)
 
 
 @router.post("", response_model=EmployeeResponse, status_code=status.HTTP_201_CREATED)
@@ -70,13 +67,9 @@ def create_employee(
 @router.get("/active", response_model=EmployeeListResponse)
 def list_active_employees(db: Session = Depends(get_db)):
     """Pobierz liste tylko aktywnych pracownikow."""
-    employees = employee_service.get_employees(db, include_inactive=False)
-    total = employee_service.count_employees(db, include_inactive=False)
-
-    return EmployeeListResponse(
-        items=[_to_response(e) for e in employees],
-        total=total,
-    )
+    employees, total = employee_service.get_employees_with_total(db, include_inactive=False)
+    content = EmployeeListResponse(items=employees, total=total).model_dump_json()
+    return json_response(content)
 
 
 @router.get("/{employee_id}", response_model=EmployeeResponse)
@@ -176,7 +169,11 @@ def activate_employee(
     return _to_response(employee)
 
 
-@router.delete("/{employee_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{employee_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_class=Response,
+)
 def delete_employee(
     employee_id: int,
     db: Session = Depends(get_db),
@@ -194,3 +191,4 @@ def delete_employee(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
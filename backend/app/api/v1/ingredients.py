@@ -2,7 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.api.deps import get_db
+from app.core.etag import json_response
 from app.core.i18n import t
+from app.models.ingredient import Ingredient
 from app.schemas.ingredient import (
     IngredientCreate,
     IngredientUpdate,
@@ -14,6 +16,21 @@ from app.services import ingredient_service
 router = APIRouter()
 
 
+def _to_response(ingredient: Ingredient) -> IngredientResponse:
+    """Convert Ingredient model to IngredientResponse schema."""
+    return IngredientResponse.model_construct(
+        id=ingredient.id,
+        name=ingredient.name,
+        unit_type=ingredient.unit_type,
+        unit_label=ingredient.unit_label,
+        is_active=ingredient.is_active,
+        current_stock_grams=float(ingredient.current_stock_grams),
+        current_stock_count=ingredient.current_stock_count,
+        created_at=ingredient.created_at,
+        updated_at=ingredient.updated_at,
+    )
+
+
 @router.get("", response_model=IngredientListResponse)
 def list_ingredients(
     skip: int = 0,
@@ -23,7 +40,10 @@ def list_ingredients(
 ):
     """Pobierz liste wszystkich skladnikow."""
     items, total = ingredient_service.get_ingredients(db, skip, limit, is_active=is_active)
-    return IngredientListResponse(items=items, total=total)
+    content = IngredientListResponse.model_construct(
+        items=[_to_response(ingredient) for ingredient in items], total=total
+    ).model_dump_json()
+    return json_response(content)
 
 
 @router.post("", response_model=IngredientResponse, status_code=status.HTTP_201_CREATED)
@@ -5,10 +5,12 @@ Provides endpoints for managing inventory snapshots and calculating discrepancie
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from decimal import Decimal
+from typing import Optional
 
 from app.api.deps import get_db
+from app.core.etag import json_response
 from app.core.i18n import t
 from app.schemas.inventory import (
     InventorySnapshotCreate,
@@ -21,8 +23,9 @@ from app.schemas.inventory import (
     StockAdjustmentCreate,
     StockAdjustmentResponse,
 )
-from app.models.inventory_snapshot import SnapshotType, InventoryLocation
-from app.services import inventory_service
+from app.models.ingredient import UnitType
+from app.models.inventory_snapshot import SnapshotType
+from app.services import daily_operations_service, inventory_service
 from app.services.inventory_service import (
     IngredientNotFoundError,
     ShopAdjustmentNotSupportedError,
@@ -31,13 +34,48 @@ from app.services.inventory_service import (
 
 router = APIRouter()
 
+_current_stock_adapter = TypeAdapter(list[CurrentStock])
+_stock_level_adapter = TypeAdapter(list[StockLevel])
+_snapshot_list_adapter = TypeAdapter(list[InventorySnapshotResponse])
+_discrepancy_list_adapter = TypeAdapter(list[InventoryDiscrepancy])
+_transfer_stock_adapter = TypeAdapter(list[TransferStockItem])
+
+
+def _to_snapshot_response(
+    snapshot,
+    ingredient_name: Optional[str],
+    unit_type: Optional[UnitType],
+) -> InventorySnapshotResponse:
+    """
+    Convert an InventorySnapshot model or projected snapshot row to
+    InventorySnapshotResponse.
+
+    The row comes straight from the database (quantity is already a Decimal
+    from the Numeric column), so the response is built without re-validation.
+    """
+    quantity = snapshot.quantity
+    return InventorySnapshotResponse.model_construct(
+        id=snapshot.id,
+        daily_record_id=snapshot.daily_record_id,
+        ingredient_id=snapshot.ingredient_id,
+        ingredient_name=ingredient_name,
+        snapshot_type=snapshot.snapshot_type,
+        location=snapshot.location,
+        quantity=quantity,
+        # Legacy fields for backwards compatibility
+        quantity_grams=quantity if unit_type == UnitType.WEIGHT else None,
+        quantity_count=int(quantity) if unit_type == UnitType.COUNT else None,
+        recorded_at=snapshot.recorded_at,
+    )
+
 
 @router.get("/current", response_model=list[CurrentStock])
 def get_current_stock(
     db: Session = Depends(get_db),
 ):
     """Pobierz aktualny stan magazynowy."""
-    return inventory_service.get_current_stock(db)
+    stock = inventory_service.get_current_stock(db)
+    return json_response(_current_stock_adapter.dump_json(stock))
 
 
 @router.get("/stock-levels", response_model=list[StockLevel])
@@ -50,7 +88,8 @@ def get_stock_levels(
     Zwraca aktualne ilosci w magazynie i sklepie dla kazdego skladnika,
     wraz z informacjami o partiach i najbliższej dacie waznosci.
     """
-    return inventory_service.get_stock_levels(db)
+    levels = inventory_service.get_stock_levels(db)
+    return json_response(_stock_level_adapter.dump_json(levels))
 
 
 @router.get("/daily-record/{daily_record_id}/snapshots", response_model=list[InventorySnapshotResponse])
@@ -59,23 +98,9 @@ def get_snapshots_for_day(
     db: Session = Depends(get_db),
 ):
     """Pobierz snapshoty inwentarza dla danego dnia."""
-    snapshots = inventory_service.get_snapshots_for_day(db, daily_record_id)
-    return [
-        InventorySnapshotResponse(
-            id=s.id,
-            daily_record_id=s.daily_record_id,
-            ingredient_id=s.ingredient_id,
-            ingredient_name=s.ingredient.name if s.ingredient else None,
-            snapshot_type=s.snapshot_type,
-            location=s.location,
-            quantity=Decimal(str(s.quantity)),
-            # Legacy fields for backwards compatibility
-            quantity_grams=Decimal(str(s.quantity)) if s.ingredient and s.ingredient.unit_type.value == "weight" else None,
-            quantity_count=int(s.quantity) if s.ingredient and s.ingredient.unit_type.value == "count" else None,
-            recorded_at=s.recorded_at,
-        )
-        for s in snapshots
-    ]
+    rows = inventory_service.get_snapshots_for_day(db, daily_record_id)
+    items = [_to_snapshot_response(row, row.ingredient_name, row.unit_type) for row in rows]
+    return json_response(_snapshot_list_adapter.dump_json(items))
 
 
 @router.get("/discrepancies/{daily_record_id}", response_model=list[InventoryDiscrepancy])
@@ -84,7 +109,8 @@ def get_discrepancies(
     db: Session = Depends(get_db),
 ):
     """Oblicz rozbieznosci inwentarza dla danego dnia."""
-    return inventory_service.calculate_discrepancies(db, daily_record_id)
+    discrepancies = inventory_service.calculate_discrepancies(db, daily_record_id)
+    return json_response(_discrepancy_list_adapter.dump_json(discrepancies))
 
 
 @router.post("/snapshot", response_model=InventorySnapshotResponse, status_code=status.HTTP_201_CREATED)
@@ -95,20 +121,14 @@ def create_snapshot(
     db: Session = Depends(get_db),
 ):
     """Utworz snapshot inwentarza."""
-    location = data.location if hasattr(data, 'location') else InventoryLocation.SHOP
-    snapshot = inventory_service.create_snapshot(db, daily_record_id, snapshot_type, data, location)
-    return InventorySnapshotResponse(
-        id=snapshot.id,
-        daily_record_id=snapshot.daily_record_id,
-        ingredient_id=snapshot.ingredient_id,
-        ingredient_name=snapshot.ingredient.name if snapshot.ingredient else None,
-        snapshot_type=snapshot.snapshot_type,
-        location=snapshot.location,
-        quantity=Decimal(str(snapshot.quantity)),
-        # Legacy fields for backwards compatibility
-        quantity_grams=Decimal(str(snapshot.quantity)) if snapshot.ingredient and snapshot.ingredient.unit_type.value == "weight" else None,
-        quantity_count=int(snapshot.quantity) if snapshot.ingredient and snapshot.ingredient.unit_type.value == "count" else None,
-        recorded_at=snapshot.recorded_at,
+    snapshot = inventory_service.create_snapshot(db, daily_record_id, snapshot_type, data, data.location)
+    # The day's status is not checked, so this may rewrite a closed day's counts
+    daily_operations_service.clear_closed_day_alerts_cache()
+    ingredient = snapshot.ingredient
+    return _to_snapshot_response(
+        snapshot,
+        ingredient.name if ingredient else None,
+        ingredient.unit_type if ingredient else None,
     )
 
 
@@ -144,7 +164,8 @@ def get_transfer_stock(
     Uzywane w oknie dialogowym transferu aby pomoc uzytkownikom
     zdecydowac ile przenieść.
     """
-    return inventory_service.get_transfer_stock_info(db, daily_record_id)
+    items = inventory_service.get_transfer_stock_info(db, daily_record_id)
+    return json_response(_transfer_stock_adapter.dump_json(items))
 
 
 @router.post("/adjustment", response_model=StockAdjustmentResponse, status_code=status.HTTP_201_CREATED)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from app.api.deps import get_db
+from app.core.etag import json_response
 from app.core.i18n import t
 from app.models.position import Position
 from app.schemas.position import (
@@ -21,7 +22,7 @@ router = APIRouter()
 
 def _to_response(position: Position, employee_count: int = 0) -> PositionResponse:
     """Convert Position model to PositionResponse schema."""
-    return PositionResponse(
+    return PositionResponse.model_construct(
         id=position.id,
         name=position.name,
         hourly_rate=position.hourly_rate,
@@ -33,15 +34,12 @@ def _to_response(position: Position, employee_count: int = 0) -> PositionRespons
 @router.get("", response_model=PositionListResponse)
 def list_positions(db: Session = Depends(get_db)):
     """Pobierz liste wszystkich stanowisk."""
-    positions = position_service.get_positions(db)
-
-    # Get employee counts for each position
-    items = []
-    for position in positions:
-        count = position_service.get_employee_count_for_position(db, position.id)
-        items.append(_to_response(position, count))
-
-    return PositionListResponse(items=items, total=len(items))
+    items = [
+        _to_response(position, count)
+        for position, count in position_service.get_positions_with_counts(db)
+    ]
+    content = PositionListResponse(items=items, total=len(items)).model_dump_json()
+    return json_response(content)
 
 
 @router.post("", response_model=PositionResponse, status_code=status.HTTP_201_CREATED)
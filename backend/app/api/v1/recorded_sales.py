@@ -11,6 +11,7 @@ Provides endpoints for:
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -57,14 +58,14 @@ def record_sale(
     - Wariant produktu musi istniec i byc aktywny
     """
     # Check if daily record exists and is open
-    daily_record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-    if not daily_record:
+    day_status = db.query(DailyRecord.status).filter(DailyRecord.id == record_id).scalar()
+    if day_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.daily_record_not_found"),
         )
 
-    if daily_record.status != DayStatus.OPEN:
+    if day_status != DayStatus.OPEN:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=t("errors.day_not_open_for_sales"),
@@ -104,8 +105,7 @@ def list_recorded_sales(
     Zwraca liste sprzedazy posortowana od najnowszych.
     """
     # Check if daily record exists
-    daily_record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-    if not daily_record:
+    if not db.query(exists().where(DailyRecord.id == record_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.daily_record_not_found"),
@@ -135,8 +135,7 @@ def get_day_sales_total(
     - items_count: Laczna liczba sprzedanych sztuk
     """
     # Check if daily record exists
-    daily_record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-    if not daily_record:
+    if not db.query(exists().where(DailyRecord.id == record_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.daily_record_not_found"),
@@ -171,14 +170,14 @@ def void_sale(
     - Sprzedaz musi nalezec do tego dnia
     """
     # Check if daily record exists and is open
-    daily_record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-    if not daily_record:
+    day_status = db.query(DailyRecord.status).filter(DailyRecord.id == record_id).scalar()
+    if day_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.daily_record_not_found"),
         )
 
-    if daily_record.status != DayStatus.OPEN:
+    if day_status != DayStatus.OPEN:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=t("errors.cannot_void_sale_closed_day"),
@@ -225,8 +224,7 @@ def get_reconciliation_report(
     - suggestions: Sugestie brakujacych sprzedazy
     """
     # Check if daily record exists
-    daily_record = db.query(DailyRecord).filter(DailyRecord.id == record_id).first()
-    if not daily_record:
+    if not db.query(exists().where(DailyRecord.id == record_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=t("errors.daily_record_not_found"),
@@ -0,0 +1,46 @@
+"""
+Small in-process caches for data that is read often and written rarely.
+
+Entries expire after a TTL, which bounds staleness for writes made outside
+the API (e.g. manual SQL). Writes through the API call clear(), which also
+bumps a generation counter so a value computed from data read before the
+write is not stored afterwards.
+"""
+
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """Dict cache whose entries expire after ttl_seconds."""
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Read before computing a value and pass it to set()."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """Store a value unless the cache was cleared since `generation` was read."""
+        if generation == self._generation:
+            self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        """Drop all entries and invalidate values still being computed."""
+        self._generation += 1
+        self._entries.clear()
@@ -1,11 +1,32 @@
 from sqlalchemy import create_engine, Enum as SQLAlchemyEnum
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, raiseload
+from sqlalchemy.pool import NullPool
 from app.config import get_settings
 from enum import Enum
 
 settings = get_settings()
 
-engine = create_engine(settings.database_url)
+
+def _engine_options() -> dict:
+    """
+    Pool options for the application engine.
+
+    Connections are checked with pre-ping before use, so ones dropped by the
+    server or a firewall after idling are replaced instead of failing the
+    request, and recycled before typical idle timeouts kick in.
+    """
+    if settings.db_null_pool:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
+engine = create_engine(settings.database_url, **_engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -40,6 +61,22 @@ def EnumColumn(enum_class: type[Enum], **kwargs):
     )
 
 
+def eager_options(*options):
+    """
+    Return query loader options, guarded by raiseload("*") in strict mode.
+
+    With settings.strict_loading enabled, any relationship the query did not
+    eager-load raises instead of silently emitting one SELECT per row, so a
+    dropped joinedload/selectinload fails the tests instead of becoming N+1.
+
+    Usage:
+        db.query(Employee).options(*eager_options(joinedload(Employee.position)))
+    """
+    if get_settings().strict_loading:
+        return (*options, raiseload("*"))
+    return options
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -0,0 +1,54 @@
+"""
+JSON responses from pre-serialized bytes, with optional conditional GET.
+
+Endpoints serialize their payload themselves with pydantic-core
+(model_dump_json / TypeAdapter.dump_json), which turns the whole list into
+JSON bytes in one Rust call. Returning those bytes in a Response makes
+FastAPI skip its own response_model validation and jsonable_encoder pass.
+The decorators keep response_model, so the OpenAPI schema is unchanged.
+
+The ETag is a hash of the response body, so it is always in sync with the
+data no matter where a change came from. On a match the client gets an
+empty 304 and reuses its cached copy.
+"""
+
+import hashlib
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def _etag_for(content: bytes) -> str:
+    return f'W/"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def json_response(content: bytes) -> Response:
+    """Return already serialized JSON content."""
+    return Response(content=content, media_type="application/json")
+
+
+def json_response_with_etag(request: Request, content: bytes) -> Response:
+    """
+    Return JSON content with an ETag, or 304 if the client already has it.
+
+    Cache-Control asks the browser to revalidate on every use, so clients
+    never act on stale data but skip the download when nothing changed.
+    """
+    etag = _etag_for(content)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
@@ -6,10 +7,20 @@ from app.core.middleware import LanguageMiddleware
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the OpenAPI schema once at startup (FastAPI caches it on the app)
+    # so the first /docs or /openapi.json request does not pay for it
+    app.openapi()
+    yield
+
+
 app = FastAPI(
     title="Small Gastro API",
     description="API dla aplikacji do zarzadzania mala gastronomia",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add language detection middleware (must be added before CORS)
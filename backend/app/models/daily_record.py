@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Date, DateTime, Text, Index
+from sqlalchemy import Column, Integer, String, Numeric, Date, DateTime, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -13,7 +13,7 @@ class DayStatus(str, enum.Enum):
 class DailyRecord(Base):
     __tablename__ = "daily_records"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     date = Column(Date, nullable=False, unique=True, index=True)  # Frequently filtered
     status = Column(EnumColumn(DayStatus), nullable=False, default=DayStatus.OPEN)
 
@@ -35,6 +35,15 @@ class DailyRecord(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Partial index for the open day lookup (at most a few rows)
+        Index(
+            "ix_daily_records_open_date",
+            "date",
+            postgresql_where=text("status = 'open'"),
+        ),
+    )
+
     # Relationships
     inventory_snapshots = relationship("InventorySnapshot", back_populates="daily_record", cascade="all, delete-orphan")
     sales_items = relationship("SalesItem", back_populates="daily_record", cascade="all, delete-orphan")  # Legacy
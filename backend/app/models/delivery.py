@@ -12,7 +12,7 @@ class Delivery(Base):
     """
     __tablename__ = "deliveries"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False, index=True)
     supplier_name = Column(String(255), nullable=True)
     invoice_number = Column(String(100), nullable=True)
@@ -39,9 +39,9 @@ class DeliveryItem(Base):
     """
     __tablename__ = "delivery_items"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     delivery_id = Column(Integer, ForeignKey("deliveries.id", ondelete="CASCADE"), nullable=False, index=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False)
     quantity = Column(Numeric(10, 3), nullable=False)  # In ingredient's unit (kg or count)
     cost_pln = Column(Numeric(10, 2), nullable=True)  # Optional per-item cost
     expiry_date = Column(Date, nullable=True)  # Optional expiry date for batch tracking
@@ -12,7 +12,7 @@ class Employee(Base):
     """
     __tablename__ = "employees"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(200), nullable=False)
     position_id = Column(Integer, ForeignKey("positions.id"), nullable=False)
     hourly_rate_override = Column(Numeric(10, 2), nullable=True)  # NULL means use position's rate
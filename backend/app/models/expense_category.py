@@ -10,7 +10,7 @@ class ExpenseCategory(Base):
     MAX_DEPTH = 3
     LEAF_LEVEL = 3
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     parent_id = Column(Integer, ForeignKey("expense_categories.id", ondelete="RESTRICT"), nullable=True)
     level = Column(Integer, nullable=False, default=1)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Enum as SQLEnum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -13,7 +13,7 @@ class UnitType(str, enum.Enum):
 class Ingredient(Base):
     __tablename__ = "ingredients"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, unique=True)
     unit_type = Column(SQLEnum(UnitType, values_callable=lambda x: [e.value for e in x]), nullable=False)
     unit_label = Column(String(20), nullable=False, server_default="szt")  # Display label: kg, g, szt, opak
@@ -23,6 +23,11 @@ class Ingredient(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Partial index for the soft-delete filter (active ingredients only)
+        Index("ix_ingredients_active", "id", postgresql_where=text("is_active")),
+    )
+
     # Relationships
     product_ingredients = relationship("ProductIngredient", back_populates="ingredient")
     inventory_snapshots = relationship("InventorySnapshot", back_populates="ingredient")
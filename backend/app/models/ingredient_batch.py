@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, Numeric, Boolean, Date, DateTime, Text,
-    ForeignKey, CheckConstraint, UniqueConstraint
+    ForeignKey, CheckConstraint, UniqueConstraint, Index, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -26,11 +26,11 @@ class IngredientBatch(Base):
     """
     __tablename__ = "ingredient_batches"
 
-    id = Column(Integer, primary_key=True, index=True)
-    batch_number = Column(String(20), nullable=False, unique=True, index=True)
+    id = Column(Integer, primary_key=True)
+    batch_number = Column(String(20), nullable=False)
     ingredient_id = Column(
         Integer,
-        ForeignKey("ingredients.id", ondelete="RESTRICT"),
+        ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"),
         nullable=False,
         index=True
     )
@@ -39,7 +39,7 @@ class IngredientBatch(Base):
         ForeignKey("delivery_items.id", ondelete="SET NULL"),
         nullable=True
     )
-    expiry_date = Column(Date, nullable=True, index=True)
+    expiry_date = Column(Date, nullable=True)
     initial_quantity = Column(Numeric(10, 3), nullable=False)
     remaining_quantity = Column(Numeric(10, 3), nullable=False)
     location = Column(String(20), nullable=False, server_default="storage")
@@ -49,9 +49,21 @@ class IngredientBatch(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (
+        UniqueConstraint("batch_number", name="uq_ingredient_batches_batch_number"),
         CheckConstraint("initial_quantity > 0", name="check_batch_initial_quantity_positive"),
         CheckConstraint("remaining_quantity >= 0", name="check_batch_remaining_quantity_non_negative"),
         CheckConstraint("location IN ('storage', 'shop')", name="check_batch_location_valid"),
+        # Partial index for active batches of an ingredient (FEFO / nearest expiry)
+        Index(
+            "ix_ingredient_batches_fefo",
+            "ingredient_id", "expiry_date",
+            postgresql_where=text("is_active AND remaining_quantity > 0"),
+        ),
+        Index(
+            "ix_ingredient_batches_active_expiry",
+            "expiry_date",
+            postgresql_where=text("is_active AND remaining_quantity > 0"),
+        ),
     )
 
     # Relationships
@@ -75,7 +87,7 @@ class BatchDeduction(Base):
     """
     __tablename__ = "batch_deductions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     batch_id = Column(
         Integer,
         ForeignKey("ingredient_batches.id", ondelete="CASCADE"),
@@ -22,9 +22,9 @@ class InventorySnapshot(Base):
     """
     __tablename__ = "inventory_snapshots"
 
-    id = Column(Integer, primary_key=True, index=True)
-    daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False, index=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False)
     snapshot_type = Column(SQLEnum(SnapshotType, values_callable=lambda x: [e.value for e in x]), nullable=False)
     location = Column(
         SQLEnum(InventoryLocation, values_callable=lambda x: [e.value for e in x]),
@@ -39,8 +39,13 @@ class InventorySnapshot(Base):
             "daily_record_id", "ingredient_id", "snapshot_type", "location",
             name="uq_snapshot_per_day_ingredient_type_location"
         ),
-        # Compound index for frequent queries by daily_record_id + snapshot_type
-        Index("ix_inventory_snapshots_record_type", "daily_record_id", "snapshot_type"),
+        # Covering index for frequent queries by daily_record_id + snapshot_type
+        # (also serves lookups by daily_record_id alone via its leading column)
+        Index(
+            "ix_inventory_snapshots_record_type",
+            "daily_record_id", "snapshot_type",
+            postgresql_include=["ingredient_id", "quantity", "location"],
+        ),
     )
 
     # Relationships
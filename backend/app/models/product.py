@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, ForeignKey, CheckConstraint, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -7,7 +7,7 @@ from app.core.database import Base
 class Product(Base):
     __tablename__ = "products"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, unique=True)
     has_variants = Column(Boolean, nullable=False, server_default="false")  # True for products with size variants
     is_active = Column(Boolean, nullable=False, server_default="true")
@@ -16,6 +16,11 @@ class Product(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # Partial index for the menu listing (active products by sort_order)
+        Index("ix_products_active_sort_order", "sort_order", postgresql_where=text("is_active")),
+    )
+
     # Relationships
     variants = relationship("ProductVariant", back_populates="product", cascade="all, delete-orphan")
     sales_items = relationship("SalesItem", back_populates="product")  # Legacy relationship
@@ -29,7 +34,7 @@ class ProductVariant(Base):
     """
     __tablename__ = "product_variants"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(50), nullable=True)  # NULL for single-size products
     price_pln = Column(Numeric(10, 2), nullable=False)
@@ -40,6 +45,8 @@ class ProductVariant(Base):
 
     __table_args__ = (
         CheckConstraint("price_pln > 0", name="check_variant_price_positive"),
+        # Partial index for active variants of a product
+        Index("ix_product_variants_active", "product_id", postgresql_where=text("is_active")),
     )
 
     # Relationships
@@ -56,9 +63,9 @@ class ProductIngredient(Base):
     """
     __tablename__ = "product_ingredients"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     product_variant_id = Column(Integer, ForeignKey("product_variants.id", ondelete="CASCADE"), nullable=False)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False)
     quantity = Column(Numeric(10, 3), nullable=False)  # Amount per product (in ingredient's unit)
     is_primary = Column(Boolean, nullable=False, server_default="false")  # Used for sales derivation
 
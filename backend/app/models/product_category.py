@@ -12,7 +12,7 @@ class ProductCategory(Base):
     """
     __tablename__ = "product_categories"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(50), nullable=False, unique=True)
     sort_order = Column(Integer, nullable=False, default=0, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
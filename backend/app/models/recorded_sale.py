@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, String, Numeric, DateTime, ForeignKey,
-    CheckConstraint, Index
+    CheckConstraint, Index, text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -29,7 +29,7 @@ class RecordedSale(Base):
     """
     __tablename__ = "recorded_sales"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(
         Integer,
         ForeignKey("daily_records.id", ondelete="CASCADE"),
@@ -60,6 +60,17 @@ class RecordedSale(Base):
         Index("idx_recorded_sales_daily_record", "daily_record_id"),
         Index("idx_recorded_sales_variant", "product_variant_id"),
         Index("idx_recorded_sales_recorded_at", "recorded_at"),
+        Index(
+            "idx_recorded_sales_shift_assignment",
+            "shift_assignment_id",
+            postgresql_where=text("shift_assignment_id IS NOT NULL"),
+        ),
+        Index(
+            "idx_recorded_sales_active_by_day",
+            "daily_record_id", "product_variant_id",
+            postgresql_where=text("voided_at IS NULL"),
+            postgresql_include=["quantity", "unit_price_pln"],
+        ),
     )
 
     # Relationships
@@ -7,7 +7,7 @@ from app.core.database import Base
 class SalesItem(Base):
     __tablename__ = "sales_items"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id", ondelete="RESTRICT"), nullable=False)
     quantity_sold = Column(Integer, nullable=False)
@@ -16,7 +16,7 @@ class ShiftAssignment(Base):
     """
     __tablename__ = "shift_assignments"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(
         Integer,
         ForeignKey("daily_records.id", ondelete="CASCADE"),
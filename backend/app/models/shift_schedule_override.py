@@ -22,7 +22,7 @@ class ShiftScheduleOverride(Base):
     """
     __tablename__ = "shift_schedule_overrides"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     employee_id = Column(
         Integer,
         ForeignKey("employees.id", ondelete="CASCADE"),
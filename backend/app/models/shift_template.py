@@ -19,7 +19,7 @@ class ShiftTemplate(Base):
     """
     __tablename__ = "shift_templates"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     employee_id = Column(
         Integer,
         ForeignKey("employees.id", ondelete="CASCADE"),
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Numeric, Text, DateTime, ForeignKey, Enum as SQLEnum, CheckConstraint
+from sqlalchemy import Column, Integer, Numeric, Text, DateTime, ForeignKey, Enum as SQLEnum, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -20,9 +20,9 @@ class Spoilage(Base):
     """
     __tablename__ = "spoilages"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False, index=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False)
     batch_id = Column(
         Integer,
         ForeignKey("ingredient_batches.id", ondelete="SET NULL"),
@@ -40,6 +40,8 @@ class Spoilage(Base):
 
     __table_args__ = (
         CheckConstraint("quantity > 0", name="check_spoilage_quantity_positive"),
+        # Per-ingredient usage lookups (by ingredient, optionally per day)
+        Index("ix_spoilages_ingredient_daily", "ingredient_id", "daily_record_id"),
     )
 
     # Relationships
@@ -12,8 +12,8 @@ class StorageInventory(Base):
     """
     __tablename__ = "storage_inventory"
 
-    id = Column(Integer, primary_key=True, index=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False, unique=True)
+    id = Column(Integer, primary_key=True)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False, unique=True)
     quantity = Column(Numeric(10, 3), nullable=False, server_default="0")  # In ingredient's unit
     last_counted_at = Column(DateTime(timezone=True), nullable=True)  # Last manual count
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
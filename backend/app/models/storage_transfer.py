@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import Column, Integer, Numeric, DateTime, ForeignKey, CheckConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -11,15 +11,17 @@ class StorageTransfer(Base):
     """
     __tablename__ = "storage_transfers"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     daily_record_id = Column(Integer, ForeignKey("daily_records.id", ondelete="CASCADE"), nullable=False, index=True)
-    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=False)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT", deferrable=True, initially="IMMEDIATE"), nullable=False)
     quantity = Column(Numeric(10, 3), nullable=False)  # In ingredient's unit (kg or count)
     transferred_at = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     __table_args__ = (
         CheckConstraint("quantity > 0", name="check_transfer_quantity_positive"),
+        # Per-ingredient usage lookups (by ingredient, optionally per day)
+        Index("ix_storage_transfers_ingredient_daily", "ingredient_id", "daily_record_id"),
     )
 
     # Relationships
@@ -27,7 +27,7 @@ class WagePeriodType(str, enum.Enum):
 class Transaction(Base):
     __tablename__ = "transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     type = Column(EnumColumn(TransactionType), nullable=False)
     category_id = Column(Integer, ForeignKey("expense_categories.id", ondelete="SET NULL"), nullable=True)
     amount = Column(Numeric(12, 2), nullable=False)
@@ -45,6 +45,12 @@ class Transaction(Base):
 
     __table_args__ = (
         Index("idx_transactions_date", "transaction_date"),
+        # Compact block-range index for date-range scans (dashboard, reports)
+        Index(
+            "brin_transactions_date", "transaction_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         Index("idx_transactions_type", "type"),
         Index("idx_transactions_employee", "employee_id"),
     )
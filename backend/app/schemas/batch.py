@@ -242,3 +242,9 @@ class IngredientBatchSummary(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class IngredientBatchSummariesRequest(BaseModel):
+    """Request for batch summaries of several ingredients at once."""
+    ingredient_ids: list[int] = Field(..., min_length=1, max_length=200, description="ID skladnikow")
+    location: Optional[BatchLocation] = Field(None, description="Filtruj po lokalizacji")
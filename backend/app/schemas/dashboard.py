@@ -50,3 +50,8 @@ class DiscrepancyWarning(BaseModel):
     discrepancy: Decimal
     discrepancy_percent: Decimal
     severity: str  # low, medium, high
+
+
+class DashboardData(BaseModel):
+    overview: DashboardOverview
+    warnings: list[DiscrepancyWarning]
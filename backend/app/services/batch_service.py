@@ -434,7 +434,73 @@ def get_ingredient_batch_summary(
     # FIFO ordering: oldest first
     batches = query.order_by(IngredientBatch.created_at.asc()).all()
 
+    summary = _build_ingredient_batch_summary(ingredient, batches, date.today())
+
+    return summary, None
+
+
+def get_ingredient_batch_summaries(
+    db: Session,
+    ingredient_ids: list[int],
+    location: Optional[str] = None
+) -> tuple[Optional[list[IngredientBatchSummary]], Optional[str]]:
+    """
+    Get batch summaries for several ingredients in one pass.
+
+    Same content as get_ingredient_batch_summary() per ingredient, but loads
+    all ingredients and all their active batches with one query each.
+
+    Args:
+        db: Database session
+        ingredient_ids: IDs of the ingredients, in the order to return them;
+            a repeated ID gets its summary repeated
+        location: Optional filter by location
+
+    Returns:
+        Tuple of (summaries, error_message)
+    """
+    unique_ids = list(dict.fromkeys(ingredient_ids))
+
+    ingredients = {
+        i.id: i for i in db.query(Ingredient).filter(Ingredient.id.in_(unique_ids)).all()
+    }
+    for ingredient_id in unique_ids:
+        if ingredient_id not in ingredients:
+            return None, t("errors.ingredient_id_not_found", id=ingredient_id)
+
+    query = db.query(IngredientBatch).filter(
+        IngredientBatch.ingredient_id.in_(unique_ids),
+        IngredientBatch.is_active == True,
+        IngredientBatch.remaining_quantity > 0
+    )
+
+    if location:
+        query = query.filter(IngredientBatch.location == location)
+
+    # FIFO ordering within each ingredient: oldest first
+    batches_by_ingredient: dict[int, list[IngredientBatch]] = {i: [] for i in unique_ids}
+    for batch in query.order_by(IngredientBatch.created_at.asc()).all():
+        batches_by_ingredient[batch.ingredient_id].append(batch)
+
     today = date.today()
+    summaries = [
+        _build_ingredient_batch_summary(ingredients[i], batches_by_ingredient[i], today)
+        for i in ingredient_ids
+    ]
+
+    return summaries, None
+
+
+# -----------------------------------------------------------------------------
+# Helper Functions
+# -----------------------------------------------------------------------------
+
+def _build_ingredient_batch_summary(
+    ingredient: Ingredient,
+    batches: list[IngredientBatch],
+    today: date
+) -> IngredientBatchSummary:
+    """Build IngredientBatchSummary from batches already in FIFO order."""
     total_quantity = Decimal("0")
     expiring_soon_count = 0
     batch_items = []
@@ -466,8 +532,8 @@ def get_ingredient_batch_summary(
         )
         batch_items.append(batch_item)
 
-    summary = IngredientBatchSummary(
-        ingredient_id=ingredient_id,
+    return IngredientBatchSummary(
+        ingredient_id=ingredient.id,
         ingredient_name=ingredient.name,
         unit_label=ingredient.unit_label or "szt",
         total_quantity=total_quantity,
@@ -476,12 +542,6 @@ def get_ingredient_batch_summary(
         batches=batch_items,
     )
 
-    return summary, None
-
-
-# -----------------------------------------------------------------------------
-# Helper Functions
-# -----------------------------------------------------------------------------
 
 def _build_batch_response(batch: IngredientBatch, ingredient: Ingredient) -> BatchResponse:
     """Build BatchResponse from model with calculated fields."""
@@ -7,6 +7,7 @@ from app.schemas.expense_category import (
     ExpenseCategoryTree,
     ExpenseCategoryLeafResponse,
 )
+from app.core.cache import TTLCache
 from app.core.i18n import t
 
 
@@ -14,6 +15,13 @@ from app.core.i18n import t
 MAX_CATEGORY_DEPTH = ExpenseCategory.MAX_DEPTH
 LEAF_CATEGORY_LEVEL = ExpenseCategory.LEAF_LEVEL
 
+# Tree and leaf lists are read on almost every screen but change rarely.
+# They are cached in-process per (kind, active_only) and dropped on every
+# write through this module; the TTL bounds staleness for writes made
+# outside the API (e.g. manual SQL).
+CATEGORY_CACHE_TTL_SECONDS = 60
+_category_cache = TTLCache(CATEGORY_CACHE_TTL_SECONDS)
+
 
 class CategoryNotFoundError(Exception):
     """Raised when parent category does not exist."""
@@ -25,6 +33,11 @@ class MaxDepthExceededError(Exception):
     pass
 
 
+def clear_category_cache() -> None:
+    """Drop cached category trees and leaf lists."""
+    _category_cache.clear()
+
+
 def get_categories(db: Session, active_only: bool = True) -> list[ExpenseCategory]:
     query = db.query(ExpenseCategory)
     if active_only:
@@ -37,6 +50,12 @@ def get_category(db: Session, category_id: int) -> Optional[ExpenseCategory]:
 
 
 def get_category_tree(db: Session, active_only: bool = True) -> list[ExpenseCategoryTree]:
+    cache_key = ("tree", active_only)
+    cached = _category_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _category_cache.generation
+
     categories = get_categories(db, active_only)
 
     # Build tree structure
@@ -56,11 +75,18 @@ def get_category_tree(db: Session, active_only: bool = True) -> list[ExpenseCate
         elif cat.parent_id in category_map:
             category_map[cat.parent_id].children.append(tree_cat)
 
+    _category_cache.set(cache_key, roots, generation)
     return roots
 
 
 def get_leaf_categories(db: Session, active_only: bool = True) -> list[ExpenseCategoryLeafResponse]:
     """Get only leaf categories (level 3) that can be assigned to transactions."""
+    cache_key = ("leaves", active_only)
+    cached = _category_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = _category_cache.generation
+
     # Fetch ALL categories in a single query to build paths in memory (avoids N+1)
     all_query = db.query(ExpenseCategory)
     if active_only:
@@ -94,7 +120,9 @@ def get_leaf_categories(db: Session, active_only: bool = True) -> list[ExpenseCa
             )
         )
 
-    return sorted(result, key=lambda x: x.name)
+    result.sort(key=lambda x: x.name)
+    _category_cache.set(cache_key, result, generation)
+    return result
 
 
 def get_category_path(db: Session, category_id: int) -> str:
@@ -131,6 +159,7 @@ def create_category(db: Session, category: ExpenseCategoryCreate) -> ExpenseCate
     )
     db.add(db_category)
     db.commit()
+    clear_category_cache()
     db.refresh(db_category)
     return db_category
 
@@ -145,6 +174,7 @@ def update_category(db: Session, category_id: int, category: ExpenseCategoryUpda
         setattr(db_category, field, value)
 
     db.commit()
+    clear_category_cache()
     db.refresh(db_category)
     return db_category
 
@@ -162,4 +192,5 @@ def delete_category(db: Session, category_id: int) -> bool:
     # Soft delete
     db_category.is_active = False
     db.commit()
+    clear_category_cache()
     return True
@@ -17,7 +17,7 @@ Business Rules:
 
 import math
 import logging
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func, desc
 from typing import Optional
 from datetime import date, datetime, timedelta
@@ -63,7 +63,24 @@ from app.schemas.daily_operations import (
     PreviousDayStatusResponse,
     UpdateOpeningInventoryResponse,
 )
+from app.core.cache import TTLCache
+from app.core.database import eager_options
 from app.core.i18n import t
+from app.services import inventory_service
+
+
+# Alert counts of closed days are recalculated from snapshots and mid-day
+# events on every history load, while closed days change rarely. Counts are
+# cached in-process per record and dropped by every API write that can touch
+# a closed day's snapshots: edit_closed_day, deleting a record and
+# POST /inventory/snapshot (which does not check the day's status).
+CLOSED_DAY_ALERTS_CACHE_TTL_SECONDS = 60
+_closed_day_alerts_cache = TTLCache(CLOSED_DAY_ALERTS_CACHE_TTL_SECONDS)
+
+
+def clear_closed_day_alerts_cache() -> None:
+    """Drop cached alert counts of closed days."""
+    _closed_day_alerts_cache.clear()
 
 
 # -----------------------------------------------------------------------------
@@ -127,9 +144,9 @@ def _build_spoilage_summary(spoilage: Spoilage) -> SpoilageSummaryItem:
 def _get_mid_day_events_summary(db: Session, daily_record_id: int) -> MidDayEventsSummary:
     """Get summary of all mid-day events for a record."""
     # Get deliveries with their items
-    deliveries = db.query(Delivery).options(
+    deliveries = db.query(Delivery).options(*eager_options(
         joinedload(Delivery.items).joinedload(DeliveryItem.ingredient)
-    ).filter(
+    )).filter(
         Delivery.daily_record_id == daily_record_id
     ).all()
 
@@ -141,14 +158,18 @@ def _get_mid_day_events_summary(db: Session, daily_record_id: int) -> MidDayEven
     deliveries_total = sum(delivery.total_cost_pln for delivery in deliveries)
 
     # Get transfers
-    transfers = db.query(StorageTransfer).filter(
+    transfers = db.query(StorageTransfer).options(*eager_options(
+        joinedload(StorageTransfer.ingredient)
+    )).filter(
         StorageTransfer.daily_record_id == daily_record_id
     ).all()
 
     transfer_items = [_build_transfer_summary(t) for t in transfers]
 
     # Get spoilages
-    spoilages = db.query(Spoilage).filter(
+    spoilages = db.query(Spoilage).options(*eager_options(
+        joinedload(Spoilage.ingredient)
+    )).filter(
         Spoilage.daily_record_id == daily_record_id
     ).all()
 
@@ -165,42 +186,6 @@ def _get_mid_day_events_summary(db: Session, daily_record_id: int) -> MidDayEven
     )
 
 
-def _get_ingredient_quantities_for_day(
-    db: Session,
-    daily_record_id: int,
-    ingredient_id: int
-) -> tuple[Decimal, Decimal, Decimal]:
-    """
-    Get total deliveries, transfers, and spoilage for an ingredient on a day.
-    Returns (deliveries_total, transfers_total, spoilage_total).
-    """
-    # Sum deliveries (join through DeliveryItem since deliveries have multi-item structure)
-    deliveries_sum = db.query(func.coalesce(func.sum(DeliveryItem.quantity), 0)).join(
-        Delivery, DeliveryItem.delivery_id == Delivery.id
-    ).filter(
-        Delivery.daily_record_id == daily_record_id,
-        DeliveryItem.ingredient_id == ingredient_id
-    ).scalar()
-
-    # Sum transfers
-    transfers_sum = db.query(func.coalesce(func.sum(StorageTransfer.quantity), 0)).filter(
-        StorageTransfer.daily_record_id == daily_record_id,
-        StorageTransfer.ingredient_id == ingredient_id
-    ).scalar()
-
-    # Sum spoilage
-    spoilage_sum = db.query(func.coalesce(func.sum(Spoilage.quantity), 0)).filter(
-        Spoilage.daily_record_id == daily_record_id,
-        Spoilage.ingredient_id == ingredient_id
-    ).scalar()
-
-    return (
-        Decimal(str(deliveries_sum)),
-        Decimal(str(transfers_sum)),
-        Decimal(str(spoilage_sum))
-    )
-
-
 # -----------------------------------------------------------------------------
 # Sales Derivation (Phase 4)
 # -----------------------------------------------------------------------------
@@ -238,6 +223,10 @@ def calculate_and_save_sales(
     variants_with_primary = (
         db.query(ProductVariant)
         .join(ProductIngredient)
+        .options(
+            joinedload(ProductVariant.product),
+            selectinload(ProductVariant.ingredients),
+        )
         .filter(
             ProductVariant.is_active == True,
             ProductIngredient.is_primary == True
@@ -382,7 +371,9 @@ def _get_calculated_sales_items(
     daily_record_id: int
 ) -> list[CalculatedSaleItem]:
     """Get calculated sales as response items."""
-    sales = db.query(CalculatedSale).filter(
+    sales = db.query(CalculatedSale).options(
+        joinedload(CalculatedSale.product_variant).joinedload(ProductVariant.product)
+    ).filter(
         CalculatedSale.daily_record_id == daily_record_id
     ).all()
 
@@ -562,12 +553,17 @@ def calculate_usage(
     closing_map = {item.ingredient_id: item.quantity for item in closing_inventory}
 
     # Get opening snapshots
-    opening_snapshots = db.query(InventorySnapshot).filter(
+    opening_snapshots = db.query(InventorySnapshot).options(
+        joinedload(InventorySnapshot.ingredient)
+    ).filter(
         InventorySnapshot.daily_record_id == daily_record_id,
         InventorySnapshot.snapshot_type == SnapshotType.OPEN,
         InventorySnapshot.location == InventoryLocation.SHOP
     ).all()
 
+    # Get mid-day quantities for all ingredients at once
+    quantities_map = inventory_service.get_mid_day_quantities_for_day(db, daily_record_id)
+
     for opening_snap in opening_snapshots:
         ingredient = opening_snap.ingredient
         ingredient_id = ingredient.id
@@ -575,10 +571,7 @@ def calculate_usage(
         opening_qty = Decimal(str(opening_snap.quantity))
         closing_qty = closing_map.get(ingredient_id, Decimal("0"))
 
-        # Get mid-day quantities
-        deliveries, transfers, spoilage = _get_ingredient_quantities_for_day(
-            db, daily_record_id, ingredient_id
-        )
+        deliveries, transfers, spoilage = quantities_map.get(ingredient_id, inventory_service.NO_EVENT_QUANTITIES)
 
         # Calculate expected closing (before actual closing count)
         expected = opening_qty + deliveries + transfers - spoilage
@@ -660,6 +653,7 @@ def close_day(
     _create_or_update_daily_revenue_transaction(db, db_record, total_income)
 
     db.commit()
+    clear_closed_day_alerts_cache()
     db.refresh(db_record)
 
     return CloseDayResponse(
@@ -812,6 +806,9 @@ def get_day_summary(db: Session, record_id: int) -> Optional[DaySummaryResponse]
             ).all()
             ingredient_map = {ing.id: ing for ing in ingredients}
 
+            # Get mid-day quantities for all ingredients at once
+            quantities_map = inventory_service.get_mid_day_quantities_for_day(db, record_id)
+
             for opening_snap in opening_snapshots:
                 ingredient = ingredient_map.get(opening_snap.ingredient_id)
                 if not ingredient:
@@ -820,10 +817,7 @@ def get_day_summary(db: Session, record_id: int) -> Optional[DaySummaryResponse]
                 ingredient_id = opening_snap.ingredient_id
                 opening_qty = Decimal(str(opening_snap.quantity))
 
-                # Get mid-day quantities
-                deliveries, transfers, spoilage = _get_ingredient_quantities_for_day(
-                    db, record_id, ingredient_id
-                )
+                deliveries, transfers, spoilage = quantities_map.get(ingredient_id, inventory_service.NO_EVENT_QUANTITIES)
 
                 # Calculate expected closing (before actual closing count)
                 expected = opening_qty + deliveries + transfers - spoilage
@@ -1037,6 +1031,7 @@ def edit_closed_day(
     _create_or_update_daily_revenue_transaction(db, db_record, total_income)
 
     db.commit()
+    clear_closed_day_alerts_cache()
     db.refresh(db_record)
 
     return EditClosedDayResponse(
@@ -1136,24 +1131,35 @@ def get_daily_record_detail(db: Session, record_id: int) -> Optional[DailyRecord
     if not db_record:
         return None
 
-    # Get opening snapshots
-    opening_snapshots = db.query(InventorySnapshot).filter(
-        InventorySnapshot.daily_record_id == record_id,
-        InventorySnapshot.snapshot_type == SnapshotType.OPEN,
-        InventorySnapshot.location == InventoryLocation.SHOP
-    ).all()
-    opening_responses = [_build_snapshot_response(s) for s in opening_snapshots]
+    return build_daily_record_detail(db, db_record)
 
-    # Get closing snapshots
-    closing_snapshots = db.query(InventorySnapshot).filter(
-        InventorySnapshot.daily_record_id == record_id,
-        InventorySnapshot.snapshot_type == SnapshotType.CLOSE,
+
+def build_daily_record_detail(db: Session, db_record: DailyRecord) -> DailyRecordDetailResponse:
+    """
+    Build the detail response for an already loaded daily record.
+
+    Lets callers that looked the record up themselves (today, open day)
+    skip a second lookup by ID.
+    """
+    # Opening and closing shop snapshots in one query, ingredients eager-loaded
+    shop_snapshots = db.query(InventorySnapshot).options(*eager_options(
+        joinedload(InventorySnapshot.ingredient)
+    )).filter(
+        InventorySnapshot.daily_record_id == db_record.id,
+        InventorySnapshot.snapshot_type.in_([SnapshotType.OPEN, SnapshotType.CLOSE]),
         InventorySnapshot.location == InventoryLocation.SHOP
     ).all()
-    closing_responses = [_build_snapshot_response(s) for s in closing_snapshots]
+    opening_responses = [
+        _build_snapshot_response(s) for s in shop_snapshots
+        if s.snapshot_type == SnapshotType.OPEN
+    ]
+    closing_responses = [
+        _build_snapshot_response(s) for s in shop_snapshots
+        if s.snapshot_type == SnapshotType.CLOSE
+    ]
 
     # Get mid-day events
-    mid_day_events = _get_mid_day_events_summary(db, record_id)
+    mid_day_events = _get_mid_day_events_summary(db, db_record.id)
 
     return DailyRecordDetailResponse(
         id=db_record.id,
@@ -1183,6 +1189,56 @@ def get_today_record(db: Session) -> Optional[DailyRecord]:
     return db.query(DailyRecord).filter(DailyRecord.date == today).first()
 
 
+def _count_closed_day_alerts(db: Session, record_id: int) -> int:
+    """Count warning/critical discrepancies of a closed day."""
+    # Get usage items and count warnings/criticals
+    closing_snapshots = db.query(InventorySnapshot).filter(
+        InventorySnapshot.daily_record_id == record_id,
+        InventorySnapshot.snapshot_type == SnapshotType.CLOSE,
+        InventorySnapshot.location == InventoryLocation.SHOP
+    ).all()
+
+    if not closing_snapshots:
+        return 0
+
+    closing_items = [
+        InventorySnapshotItem(
+            ingredient_id=s.ingredient_id,
+            quantity=Decimal(str(s.quantity))
+        )
+        for s in closing_snapshots
+    ]
+    usage_items = calculate_usage(db, record_id, closing_items)
+
+    # Get ingredient lookup
+    ingredient_ids = [item.ingredient_id for item in usage_items]
+    ingredients = db.query(Ingredient).filter(
+        Ingredient.id.in_(ingredient_ids)
+    ).all()
+    ingredient_map = {ing.id: ing for ing in ingredients}
+
+    alerts_count = 0
+    for item in usage_items:
+        ingredient = ingredient_map.get(item.ingredient_id)
+        if ingredient:
+            response_item = _build_usage_item_response(item, ingredient)
+            if response_item.discrepancy_level in ("warning", "critical"):
+                alerts_count += 1
+    return alerts_count
+
+
+def _get_closed_day_alerts_count(db: Session, record_id: int) -> int:
+    """Cached wrapper around _count_closed_day_alerts."""
+    alerts_count = _closed_day_alerts_cache.get(record_id)
+    if alerts_count is not None:
+        return alerts_count
+    generation = _closed_day_alerts_cache.generation
+
+    alerts_count = _count_closed_day_alerts(db, record_id)
+    _closed_day_alerts_cache.set(record_id, alerts_count, generation)
+    return alerts_count
+
+
 def get_recent_records(db: Session, limit: int = 7) -> list[dict]:
     """
     Get recent daily records for history display.
@@ -1198,36 +1254,7 @@ def get_recent_records(db: Session, limit: int = 7) -> list[dict]:
         # Count discrepancy alerts for closed days
         alerts_count = 0
         if record.status == DayStatus.CLOSED:
-            # Get usage items and count warnings/criticals
-            closing_snapshots = db.query(InventorySnapshot).filter(
-                InventorySnapshot.daily_record_id == record.id,
-                InventorySnapshot.snapshot_type == SnapshotType.CLOSE,
-                InventorySnapshot.location == InventoryLocation.SHOP
-            ).all()
-
-            if closing_snapshots:
-                closing_items = [
-                    InventorySnapshotItem(
-                        ingredient_id=s.ingredient_id,
-                        quantity=Decimal(str(s.quantity))
-                    )
-                    for s in closing_snapshots
-                ]
-                usage_items = calculate_usage(db, record.id, closing_items)
-
-                # Get ingredient lookup
-                ingredient_ids = [item.ingredient_id for item in usage_items]
-                ingredients = db.query(Ingredient).filter(
-                    Ingredient.id.in_(ingredient_ids)
-                ).all()
-                ingredient_map = {ing.id: ing for ing in ingredients}
-
-                for item in usage_items:
-                    ingredient = ingredient_map.get(item.ingredient_id)
-                    if ingredient:
-                        response_item = _build_usage_item_response(item, ingredient)
-                        if response_item.discrepancy_level in ("warning", "critical"):
-                            alerts_count += 1
+            alerts_count = _get_closed_day_alerts_count(db, record.id)
 
         result.append({
             "id": record.id,
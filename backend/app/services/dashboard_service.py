@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from typing import Optional
 from datetime import date, timedelta
 from decimal import Decimal
 from app.models.transaction import Transaction, TransactionType, PaymentMethod
@@ -12,6 +13,7 @@ from app.schemas.dashboard import (
     ExpensesBreakdown,
     ProfitData,
     DiscrepancyWarning,
+    DashboardData,
 )
 from app.services import inventory_service
 
@@ -65,7 +67,10 @@ def _calculate_expenses(db: Session, date_from: date, date_to: date) -> Decimal:
     return Decimal(str(expenses_result)) if expenses_result is not None else Decimal("0")
 
 
-def get_dashboard_overview(db: Session) -> DashboardOverview:
+def get_dashboard_overview(
+    db: Session,
+    warnings: Optional[list[DiscrepancyWarning]] = None,
+) -> DashboardOverview:
     today = date.today()
 
     # Today
@@ -89,8 +94,9 @@ def get_dashboard_overview(db: Session) -> DashboardOverview:
     today_record = db.query(DailyRecord).filter(DailyRecord.date == today).first()
     day_is_open = today_record is not None and today_record.status == DayStatus.OPEN
 
-    # Count active warnings
-    warnings = get_discrepancy_warnings(db, days_back=7)
+    # Count active warnings (callers that already have last week's warnings pass them in)
+    if warnings is None:
+        warnings = get_discrepancy_warnings(db, days_back=7)
     active_warnings = len([w for w in warnings if w.severity in ["medium", "high"]])
 
     return DashboardOverview(
@@ -257,3 +263,17 @@ def get_discrepancy_warnings(db: Session, days_back: int = 7) -> list[Discrepanc
     warnings.sort(key=lambda w: (severity_order.get(w.severity, 3), -abs(w.discrepancy_percent)))
 
     return warnings
+
+
+def get_dashboard_data(db: Session) -> DashboardData:
+    """
+    Overview and last week's warnings for the dashboard page in one call.
+
+    Warnings are calculated once and reused for the overview's
+    active_warnings count instead of being recalculated per endpoint.
+    """
+    warnings = get_discrepancy_warnings(db, days_back=7)
+    return DashboardData(
+        overview=get_dashboard_overview(db, warnings=warnings),
+        warnings=warnings,
+    )
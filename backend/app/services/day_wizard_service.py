@@ -29,6 +29,7 @@ from app.models.spoilage import Spoilage
 from app.models.shift_assignment import ShiftAssignment
 from app.models.employee import Employee
 from app.models.position import Position
+from app.services import inventory_service
 
 from app.schemas.day_wizard import (
     WizardStep,
@@ -117,42 +118,6 @@ def _calculate_discrepancy_level(percent: Optional[Decimal]) -> DiscrepancyLevel
         return DiscrepancyLevel.CRITICAL
 
 
-def _get_ingredient_quantities_for_day(
-    db: Session,
-    daily_record_id: int,
-    ingredient_id: int
-) -> tuple[Decimal, Decimal, Decimal]:
-    """
-    Get total deliveries, transfers, and spoilage for an ingredient on a day.
-    Returns (deliveries_total, transfers_total, spoilage_total).
-    """
-    # Sum deliveries (join through DeliveryItem since deliveries have multi-item structure)
-    deliveries_sum = db.query(func.coalesce(func.sum(DeliveryItem.quantity), 0)).join(
-        Delivery, DeliveryItem.delivery_id == Delivery.id
-    ).filter(
-        Delivery.daily_record_id == daily_record_id,
-        DeliveryItem.ingredient_id == ingredient_id
-    ).scalar()
-
-    # Sum transfers
-    transfers_sum = db.query(func.coalesce(func.sum(StorageTransfer.quantity), 0)).filter(
-        StorageTransfer.daily_record_id == daily_record_id,
-        StorageTransfer.ingredient_id == ingredient_id
-    ).scalar()
-
-    # Sum spoilage
-    spoilage_sum = db.query(func.coalesce(func.sum(Spoilage.quantity), 0)).filter(
-        Spoilage.daily_record_id == daily_record_id,
-        Spoilage.ingredient_id == ingredient_id
-    ).scalar()
-
-    return (
-        Decimal(str(deliveries_sum)),
-        Decimal(str(transfers_sum)),
-        Decimal(str(spoilage_sum))
-    )
-
-
 # =============================================================================
 # Day Wizard Service Class
 # =============================================================================
@@ -481,32 +446,34 @@ class DayWizardService:
             # Get day of week (0=Monday, 6=Sunday)
             day_of_week = target_date.weekday()
 
-            # Query shift templates for this day
-            templates = self.db.query(ShiftTemplate).filter(
-                ShiftTemplate.day_of_week == day_of_week
+            # Templates for this day together with their active employee and
+            # position, in one query instead of two lookups per template
+            rows = self.db.query(
+                Employee.id,
+                Employee.name,
+                Position.name.label("position_name"),
+                ShiftTemplate.start_time,
+                ShiftTemplate.end_time,
+            ).join(
+                Employee, Employee.id == ShiftTemplate.employee_id
+            ).outerjoin(
+                Position, Position.id == Employee.position_id
+            ).filter(
+                ShiftTemplate.day_of_week == day_of_week,
+                Employee.is_active == True,  # noqa: E712
             ).all()
 
-            suggestions = []
-            for template in templates:
-                employee = self.db.query(Employee).filter(
-                    Employee.id == template.employee_id
-                ).first()
-
-                if employee and employee.is_active:
-                    position = self.db.query(Position).filter(
-                        Position.id == employee.position_id
-                    ).first()
-
-                    suggestions.append(SuggestedShift(
-                        employee_id=employee.id,
-                        employee_name=employee.name,
-                        position_name=position.name if position else "",
-                        start_time=template.start_time,
-                        end_time=template.end_time,
-                        source="template",
-                    ))
-
-            return suggestions
+            return [
+                SuggestedShift(
+                    employee_id=row.id,
+                    employee_name=row.name,
+                    position_name=row.position_name or "",
+                    start_time=row.start_time,
+                    end_time=row.end_time,
+                    source="template",
+                )
+                for row in rows
+            ]
 
         except ImportError:
             # ShiftTemplate model doesn't exist yet, return empty list
@@ -563,6 +530,9 @@ class DayWizardService:
         ).all()
         ingredient_map = {ing.id: ing for ing in ingredients}
 
+        # Get mid-day quantities for all ingredients at once
+        quantities_map = inventory_service.get_mid_day_quantities_for_day(self.db, daily_record_id)
+
         for opening_snap in opening_snapshots:
             ingredient = ingredient_map.get(opening_snap.ingredient_id)
             if not ingredient:
@@ -574,10 +544,7 @@ class DayWizardService:
             # Get closing quantity from input
             closing_qty = closing_inventory.get(ingredient_id)
 
-            # Get mid-day quantities
-            deliveries, transfers, spoilage = _get_ingredient_quantities_for_day(
-                self.db, daily_record_id, ingredient_id
-            )
+            deliveries, transfers, spoilage = quantities_map.get(ingredient_id, inventory_service.NO_EVENT_QUANTITIES)
 
             # Calculate expected closing (before actual count)
             expected = opening_qty + deliveries + transfers - spoilage
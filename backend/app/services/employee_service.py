@@ -5,7 +5,8 @@ from app.models.employee import Employee
 from app.models.position import Position
 from app.models.shift_assignment import ShiftAssignment
 from app.models.transaction import Transaction
-from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.schemas.employee import EmployeeCreate, EmployeeUpdate, EmployeeResponse
+from app.core.database import eager_options
 from app.core.i18n import t
 
 
@@ -32,7 +33,7 @@ def get_employees(
     Get all employees with position data.
     By default only returns active employees.
     """
-    query = db.query(Employee).options(joinedload(Employee.position))
+    query = db.query(Employee).options(*eager_options(joinedload(Employee.position)))
 
     if not include_inactive:
         query = query.filter(Employee.is_active == True)
@@ -40,6 +41,36 @@ def get_employees(
     return query.order_by(Employee.name).all()
 
 
+def get_employees_with_total(
+    db: Session,
+    include_inactive: bool = False,
+) -> tuple[list[EmployeeResponse], int]:
+    """
+    Get employee list rows together with their total count.
+
+    Selects only the response columns (position name and effective rate are
+    resolved in SQL) and adds COUNT(*) OVER (), so listing employees is one
+    round trip without loading ORM objects.
+    """
+    query = db.query(
+        Employee.id,
+        Employee.name,
+        Employee.position_id,
+        Position.name.label("position_name"),
+        func.coalesce(Employee.hourly_rate_override, Position.hourly_rate).label("hourly_rate"),
+        Employee.is_active,
+        Employee.created_at,
+        func.count().over().label("total"),
+    ).join(Position, Employee.position_id == Position.id)
+
+    if not include_inactive:
+        query = query.filter(Employee.is_active == True)
+
+    rows = query.order_by(Employee.name).all()
+    total = rows[0].total if rows else 0
+    return [EmployeeResponse.model_validate(row, from_attributes=True) for row in rows], total
+
+
 def get_employee(db: Session, employee_id: int) -> Optional[Employee]:
     """
     Get an employee by ID with position data.
@@ -169,13 +200,3 @@ def delete_employee(db: Session, employee_id: int) -> bool:
     db.commit()
 
     return True
-
-
-def count_employees(db: Session, include_inactive: bool = False) -> int:
-    """
-    Count total number of employees.
-    """
-    query = db.query(func.count(Employee.id))
-    if not include_inactive:
-        query = query.filter(Employee.is_active == True)
-    return query.scalar() or 0
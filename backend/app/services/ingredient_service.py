@@ -11,14 +11,25 @@ def get_ingredients(
     limit: int = 100,
     is_active: Optional[bool] = None
 ) -> tuple[list[Ingredient], int]:
+    """
+    Get a page of ingredients together with the total matching count.
+
+    The total comes from COUNT(*) OVER () on the page query itself, so a page
+    is one round trip. Only a page past the end (no rows to carry the count)
+    falls back to a separate COUNT.
+    """
     query = db.query(Ingredient)
 
     if is_active is not None:
         query = query.filter(Ingredient.is_active == is_active)
 
-    total = query.count()
-    items = query.offset(skip).limit(limit).all()
-    return items, total
+    rows = query.add_columns(
+        func.count().over().label("total")
+    ).offset(skip).limit(limit).all()
+    if not rows:
+        return [], query.count() if skip else 0
+
+    return [row[0] for row in rows], rows[0].total
 
 
 def get_ingredient(db: Session, ingredient_id: int) -> Optional[Ingredient]:
@@ -41,10 +41,27 @@ DISCREPANCY_THRESHOLD_OK = Decimal("5")        # < 5% is OK (green)
 DISCREPANCY_THRESHOLD_WARNING = Decimal("10")  # 5-10% is warning (yellow), > 10% is critical (red)
 
 
-def get_snapshots_for_day(db: Session, daily_record_id: int) -> list[InventorySnapshot]:
-    """Get all inventory snapshots for a daily record with eager loaded ingredients."""
-    return db.query(InventorySnapshot).options(
-        joinedload(InventorySnapshot.ingredient)
+def get_snapshots_for_day(db: Session, daily_record_id: int) -> list:
+    """
+    Get all inventory snapshots for a daily record.
+
+    Selects only the snapshot response columns plus the ingredient's name and
+    unit type (as ingredient_name / unit_type), so the rows are read without
+    hydrating InventorySnapshot or Ingredient objects. The filter is served by
+    the (daily_record_id, ingredient_id, ...) unique index.
+    """
+    return db.query(
+        InventorySnapshot.id,
+        InventorySnapshot.daily_record_id,
+        InventorySnapshot.ingredient_id,
+        Ingredient.name.label("ingredient_name"),
+        Ingredient.unit_type,
+        InventorySnapshot.snapshot_type,
+        InventorySnapshot.location,
+        InventorySnapshot.quantity,
+        InventorySnapshot.recorded_at,
+    ).outerjoin(
+        Ingredient, Ingredient.id == InventorySnapshot.ingredient_id
     ).filter(
         InventorySnapshot.daily_record_id == daily_record_id
     ).all()
@@ -115,6 +132,65 @@ def get_mid_day_quantities(
     )
 
 
+def get_mid_day_quantities_for_day(
+    db: Session,
+    daily_record_id: int
+) -> dict[int, tuple[Decimal, Decimal, Decimal]]:
+    """
+    Get total deliveries, transfers, and spoilage per ingredient on a day.
+
+    Grouped variant of get_mid_day_quantities for callers that walk every
+    ingredient. Returns {ingredient_id: (deliveries_total, transfers_total,
+    spoilage_total)}; ingredients without any events are absent.
+    """
+    deliveries = dict(
+        db.query(DeliveryItem.ingredient_id, func.sum(DeliveryItem.quantity)).join(
+            Delivery, DeliveryItem.delivery_id == Delivery.id
+        ).filter(
+            Delivery.daily_record_id == daily_record_id
+        ).group_by(DeliveryItem.ingredient_id).all()
+    )
+
+    transfers = dict(
+        db.query(StorageTransfer.ingredient_id, func.sum(StorageTransfer.quantity)).filter(
+            StorageTransfer.daily_record_id == daily_record_id
+        ).group_by(StorageTransfer.ingredient_id).all()
+    )
+
+    spoilages = dict(
+        db.query(Spoilage.ingredient_id, func.sum(Spoilage.quantity)).filter(
+            Spoilage.daily_record_id == daily_record_id
+        ).group_by(Spoilage.ingredient_id).all()
+    )
+
+    return {
+        ingredient_id: (
+            Decimal(str(deliveries.get(ingredient_id, 0))),
+            Decimal(str(transfers.get(ingredient_id, 0))),
+            Decimal(str(spoilages.get(ingredient_id, 0)))
+        )
+        for ingredient_id in deliveries.keys() | transfers.keys() | spoilages.keys()
+    }
+
+
+NO_EVENT_QUANTITIES = (Decimal("0"), Decimal("0"), Decimal("0"))
+
+
+def _get_shop_snapshot_quantities(
+    db: Session,
+    daily_record_id: int,
+    snapshot_type: SnapshotType
+) -> dict[int, Optional[Decimal]]:
+    """Get {ingredient_id: quantity} of a day's shop snapshots of one type."""
+    return dict(
+        db.query(InventorySnapshot.ingredient_id, InventorySnapshot.quantity).filter(
+            InventorySnapshot.daily_record_id == daily_record_id,
+            InventorySnapshot.snapshot_type == snapshot_type,
+            InventorySnapshot.location == InventoryLocation.SHOP
+        ).all()
+    )
+
+
 def calculate_discrepancies(db: Session, daily_record_id: int) -> list[InventoryDiscrepancy]:
     """
     Calculate discrepancies between expected and actual ingredient usage.
@@ -129,58 +205,50 @@ def calculate_discrepancies(db: Session, daily_record_id: int) -> list[Inventory
     # Get all active ingredients
     ingredients = db.query(Ingredient).filter(Ingredient.is_active == True).all()
 
-    for ingredient in ingredients:
-        # Get opening snapshot
-        opening = db.query(InventorySnapshot).filter(
-            InventorySnapshot.daily_record_id == daily_record_id,
-            InventorySnapshot.ingredient_id == ingredient.id,
-            InventorySnapshot.snapshot_type == SnapshotType.OPEN,
-            InventorySnapshot.location == InventoryLocation.SHOP
-        ).first()
+    # Load the day's snapshots, mid-day events and sales once for all
+    # ingredients instead of querying them per ingredient
+    openings = _get_shop_snapshot_quantities(db, daily_record_id, SnapshotType.OPEN)
+    closings = _get_shop_snapshot_quantities(db, daily_record_id, SnapshotType.CLOSE)
+    mid_day_quantities = get_mid_day_quantities_for_day(db, daily_record_id)
+
+    # Expected usage based on sales: SUM(product_sold * ingredient_quantity_per_product)
+    expected_usage: dict[int, Decimal] = {}
+    sales_with_ingredients = db.query(
+        ProductIngredient.ingredient_id,
+        SalesItem.quantity_sold,
+        ProductIngredient.quantity
+    ).join(
+        ProductIngredient, SalesItem.product_id == ProductIngredient.product_variant_id
+    ).filter(
+        SalesItem.daily_record_id == daily_record_id
+    ).all()
 
-        # Get closing snapshot
-        closing = db.query(InventorySnapshot).filter(
-            InventorySnapshot.daily_record_id == daily_record_id,
-            InventorySnapshot.ingredient_id == ingredient.id,
-            InventorySnapshot.snapshot_type == SnapshotType.CLOSE,
-            InventorySnapshot.location == InventoryLocation.SHOP
-        ).first()
+    for sale in sales_with_ingredients:
+        if sale.quantity_sold is not None and sale.quantity is not None:
+            expected_usage[sale.ingredient_id] = (
+                expected_usage.get(sale.ingredient_id, Decimal("0"))
+                + Decimal(str(sale.quantity_sold)) * Decimal(str(sale.quantity))
+            )
 
-        if not opening or not closing:
-            continue
+    for ingredient in ingredients:
+        opening = openings.get(ingredient.id)
+        closing = closings.get(ingredient.id)
 
         # Use unified quantity field with null safety
-        if opening.quantity is None or closing.quantity is None:
+        if opening is None or closing is None:
             continue
 
-        opening_qty = Decimal(str(opening.quantity))
-        closing_qty = Decimal(str(closing.quantity))
+        opening_qty = Decimal(str(opening))
+        closing_qty = Decimal(str(closing))
 
-        # Get mid-day quantities
-        deliveries, transfers, spoilage = get_mid_day_quantities(
-            db, daily_record_id, ingredient.id
+        deliveries, transfers, spoilage = mid_day_quantities.get(
+            ingredient.id, NO_EVENT_QUANTITIES
         )
 
         # Calculate actual usage: Opening + Deliveries + Transfers - Spoilage - Closing
         actual_used = opening_qty + deliveries + transfers - spoilage - closing_qty
 
-        # Calculate expected usage based on sales
-        # Get all sales for this day that use this ingredient
-        expected_used = Decimal("0")
-
-        sales_with_ingredient = db.query(
-            SalesItem.quantity_sold,
-            ProductIngredient.quantity
-        ).join(
-            ProductIngredient, SalesItem.product_id == ProductIngredient.product_variant_id
-        ).filter(
-            SalesItem.daily_record_id == daily_record_id,
-            ProductIngredient.ingredient_id == ingredient.id
-        ).all()
-
-        for sale in sales_with_ingredient:
-            if sale.quantity_sold is not None and sale.quantity is not None:
-                expected_used += Decimal(str(sale.quantity_sold)) * Decimal(str(sale.quantity))
+        expected_used = expected_usage.get(ingredient.id, Decimal("0"))
 
         discrepancy = actual_used - expected_used
 
@@ -298,22 +366,18 @@ def get_transfer_stock_info(
         joinedload(Ingredient.storage_inventory)
     ).filter(Ingredient.is_active == True).all()
 
+    openings = _get_shop_snapshot_quantities(db, daily_record_id, SnapshotType.OPEN)
+    mid_day_quantities = get_mid_day_quantities_for_day(db, daily_record_id)
+
     result = []
 
     for ingredient in ingredients:
-        # Get opening snapshot for shop quantity
-        opening = db.query(InventorySnapshot).filter(
-            InventorySnapshot.daily_record_id == daily_record_id,
-            InventorySnapshot.ingredient_id == ingredient.id,
-            InventorySnapshot.snapshot_type == SnapshotType.OPEN,
-            InventorySnapshot.location == InventoryLocation.SHOP
-        ).first()
-
         # Calculate shop quantity (opening + events)
-        if opening and opening.quantity is not None:
-            opening_qty = Decimal(str(opening.quantity))
-            deliveries, transfers, spoilage = get_mid_day_quantities(
-                db, daily_record_id, ingredient.id
+        opening = openings.get(ingredient.id)
+        if opening is not None:
+            opening_qty = Decimal(str(opening))
+            deliveries, transfers, spoilage = mid_day_quantities.get(
+                ingredient.id, NO_EVENT_QUANTITIES
             )
             shop_quantity = opening_qty + deliveries + transfers - spoilage
         else:
@@ -365,6 +429,25 @@ def get_stock_levels(db: Session) -> List[StockLevel]:
         joinedload(Ingredient.storage_inventory)
     ).filter(Ingredient.is_active == True).all()
 
+    # Opening shop quantities of the current/most recent day
+    openings = (
+        _get_shop_snapshot_quantities(db, current_day.id, SnapshotType.OPEN)
+        if current_day else {}
+    )
+
+    # Active batch count and nearest expiry per ingredient in one grouped query
+    batch_info = {
+        row.ingredient_id: row
+        for row in db.query(
+            IngredientBatch.ingredient_id,
+            func.count(IngredientBatch.id).label("batches_count"),
+            func.min(IngredientBatch.expiry_date).label("nearest_expiry"),
+        ).filter(
+            IngredientBatch.remaining_quantity > 0,
+            IngredientBatch.is_active == True
+        ).group_by(IngredientBatch.ingredient_id).all()
+    }
+
     result = []
 
     for ingredient in ingredients:
@@ -375,34 +458,17 @@ def get_stock_levels(db: Session) -> List[StockLevel]:
 
         # Get shop quantity from opening snapshot of current/most recent day
         shop_qty = Decimal("0")
-        if current_day:
-            opening_snapshot = db.query(InventorySnapshot).filter(
-                InventorySnapshot.daily_record_id == current_day.id,
-                InventorySnapshot.ingredient_id == ingredient.id,
-                InventorySnapshot.snapshot_type == SnapshotType.OPEN,
-                InventorySnapshot.location == InventoryLocation.SHOP
-            ).first()
-
-            if opening_snapshot and opening_snapshot.quantity is not None:
-                shop_qty = Decimal(str(opening_snapshot.quantity))
+        opening = openings.get(ingredient.id)
+        if opening is not None:
+            shop_qty = Decimal(str(opening))
 
         # Calculate total
         total_qty = warehouse_qty + shop_qty
 
-        # Get batch information (count of active batches and nearest expiry)
-        batches_count = db.query(func.count(IngredientBatch.id)).filter(
-            IngredientBatch.ingredient_id == ingredient.id,
-            IngredientBatch.remaining_quantity > 0,
-            IngredientBatch.is_active == True
-        ).scalar() or 0
-
-        # Get nearest expiry date from active batches
-        nearest_expiry = db.query(func.min(IngredientBatch.expiry_date)).filter(
-            IngredientBatch.ingredient_id == ingredient.id,
-            IngredientBatch.remaining_quantity > 0,
-            IngredientBatch.is_active == True,
-            IngredientBatch.expiry_date.isnot(None)
-        ).scalar()
+        # Batch information (count of active batches and nearest expiry)
+        batches = batch_info.get(ingredient.id)
+        batches_count = batches.batches_count if batches else 0
+        nearest_expiry = batches.nearest_expiry if batches else None
 
         result.append(StockLevel(
             ingredient_id=ingredient.id,
@@ -29,6 +29,15 @@ def get_positions(db: Session) -> list[Position]:
     return db.query(Position).order_by(Position.name).all()
 
 
+def get_positions_with_counts(db: Session) -> list[tuple[Position, int]]:
+    """
+    Get all positions together with their employee counts in one grouped query.
+    """
+    return db.query(Position, func.count(Employee.id)).outerjoin(
+        Employee, Employee.position_id == Position.id
+    ).group_by(Position.id).order_by(Position.name).all()
+
+
 def get_position(db: Session, position_id: int) -> Optional[Position]:
     """
     Get a position by ID.
@@ -260,53 +260,10 @@ def get_day_total(
         - sales_count: Number of sale records (int)
         - items_count: Total quantity of items sold (int)
     """
-    # Query non-voided sales
-    sales = db.query(RecordedSale).filter(
-        RecordedSale.daily_record_id == daily_record_id,
-        RecordedSale.voided_at.is_(None)
-    ).all()
-
-    total_pln = Decimal("0")
-    sales_count = len(sales)
-    items_count = 0
-
-    for sale in sales:
-        total_pln += sale.total_pln
-        items_count += sale.quantity
-
-    return {
-        "total_pln": total_pln,
-        "sales_count": sales_count,
-        "items_count": items_count,
-    }
-
-
-# -----------------------------------------------------------------------------
-# Get Day Total (Aggregated Query - Alternative)
-# -----------------------------------------------------------------------------
-
-def get_day_total_aggregated(
-    db: Session,
-    daily_record_id: int
-) -> dict:
-    """
-    Calculate total revenue using SQL aggregation.
-
-    More efficient for large datasets than get_day_total().
-    Excludes voided sales from calculations.
-
-    Args:
-        db: Database session
-        daily_record_id: ID of the daily record
-
-    Returns:
-        Dictionary with:
-        - total_pln: Total revenue (Decimal)
-        - sales_count: Number of sale records (int)
-        - items_count: Total quantity of items sold (int)
-    """
+    # Aggregate non-voided sales in SQL; served by the covering partial
+    # index idx_recorded_sales_active_by_day without touching the heap
     result = db.query(
-        func.count(RecordedSale.id).label("sales_count"),
+        func.count().label("sales_count"),
         func.coalesce(func.sum(RecordedSale.quantity), 0).label("items_count"),
         func.coalesce(
             func.sum(RecordedSale.quantity * RecordedSale.unit_price_pln),
@@ -318,7 +275,7 @@ def get_day_total_aggregated(
     ).first()
 
     return {
-        "total_pln": Decimal(str(result.total_pln)) if result.total_pln else Decimal("0"),
+        "total_pln": Decimal(str(result.total_pln)).quantize(Decimal("0.01")) if result.total_pln else Decimal("0"),
         "sales_count": result.sales_count or 0,
-        "items_count": result.items_count or 0,
+        "items_count": int(result.items_count or 0),
     }
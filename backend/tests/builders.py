@@ -26,6 +26,9 @@ from app.models.position import Position
 from app.models.employee import Employee
 from app.models.shift_assignment import ShiftAssignment
 from app.models.transaction import WagePeriodType
+from app.models.ingredient_batch import IngredientBatch
+from app.models.product import Product, ProductVariant
+from app.models.recorded_sale import RecordedSale
 
 
 def build_ingredient(
@@ -545,3 +548,101 @@ def build_schedule_override(
     db.add(override)
     db.flush()
     return override
+
+
+# -----------------------------------------------------------------------------
+# Ingredient Batch Builders
+# -----------------------------------------------------------------------------
+
+def build_ingredient_batch(
+    db: Session,
+    ingredient_id: int,
+    batch_number: Optional[str] = None,
+    expiry_date: Optional[date] = None,
+    initial_quantity: Decimal = Decimal("10.000"),
+    remaining_quantity: Optional[Decimal] = None,
+    location: str = "storage",
+    is_active: bool = True,
+    **overrides
+) -> IngredientBatch:
+    """Create an ingredient batch with sensible defaults."""
+    if batch_number is None:
+        count = db.query(IngredientBatch).count()
+        batch_number = f"B-TEST-{count + 1:03d}"
+    if remaining_quantity is None:
+        remaining_quantity = initial_quantity
+
+    data = {
+        "ingredient_id": ingredient_id,
+        "batch_number": batch_number,
+        "expiry_date": expiry_date,
+        "initial_quantity": initial_quantity,
+        "remaining_quantity": remaining_quantity,
+        "location": location,
+        "is_active": is_active,
+    }
+    data.update(overrides)
+
+    batch = IngredientBatch(**data)
+    db.add(batch)
+    db.flush()
+    return batch
+
+
+# -----------------------------------------------------------------------------
+# Product and Recorded Sale Builders
+# -----------------------------------------------------------------------------
+
+def build_product_variant(
+    db: Session,
+    product_name: Optional[str] = None,
+    name: Optional[str] = None,
+    price_pln: Decimal = Decimal("20.00"),
+    **overrides
+) -> ProductVariant:
+    """Create a product with a single variant and return the variant."""
+    if product_name is None:
+        count = db.query(Product).count()
+        product_name = f"Test Product {count + 1}"
+
+    product = Product(name=product_name)
+    db.add(product)
+    db.flush()
+
+    data = {
+        "product_id": product.id,
+        "name": name,
+        "price_pln": price_pln,
+        "is_default": True,
+    }
+    data.update(overrides)
+
+    variant = ProductVariant(**data)
+    db.add(variant)
+    db.flush()
+    return variant
+
+
+def build_recorded_sale(
+    db: Session,
+    daily_record_id: int,
+    product_variant_id: int,
+    quantity: int = 1,
+    unit_price_pln: Decimal = Decimal("20.00"),
+    voided_at: Optional[datetime] = None,
+    **overrides
+) -> RecordedSale:
+    """Create a recorded sale with sensible defaults."""
+    data = {
+        "daily_record_id": daily_record_id,
+        "product_variant_id": product_variant_id,
+        "quantity": quantity,
+        "unit_price_pln": unit_price_pln,
+        "voided_at": voided_at,
+    }
+    data.update(overrides)
+
+    sale = RecordedSale(**data)
+    db.add(sale)
+    db.flush()
+    return sale
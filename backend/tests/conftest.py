@@ -16,8 +16,10 @@ from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.config import get_settings
 from app.core.database import Base, get_db
 from app.api.deps import get_db as api_get_db
+from app.services import category_service, daily_operations_service
 
 
 # Use in-memory SQLite for tests (fast, no external dependencies)
@@ -63,6 +65,9 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=connection)
     session = TestingSessionLocal()
 
+    # Record IDs are reused after rollback, so per-record caches must not leak
+    daily_operations_service.clear_closed_day_alerts_cache()
+
     yield session
 
     session.close()
@@ -70,6 +75,17 @@ def db_session(db_engine) -> Generator[Session, None, None]:
     connection.close()
 
 
+@pytest.fixture(scope="function")
+def strict_loading(monkeypatch) -> None:
+    """
+    Turn on settings.strict_loading for one test.
+
+    Queries built with eager_options() then raise on any relationship they
+    did not eager-load, so a dropped joinedload/selectinload fails the test.
+    """
+    monkeypatch.setattr(get_settings(), "strict_loading", True)
+
+
 @pytest.fixture(scope="function")
 def client(db_session: Session) -> Generator[TestClient, None, None]:
     """
@@ -87,6 +103,9 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides[get_db] = override_get_db
     app.dependency_overrides[api_get_db] = override_get_db
 
+    # Rows created by one test are rolled back, so cached reads must not leak
+    category_service.clear_category_cache()
+
     with TestClient(app) as test_client:
         yield test_client
 
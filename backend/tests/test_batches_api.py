@@ -0,0 +1,151 @@
+"""
+Tests for multi-ingredient batch summaries.
+
+Test Scenarios:
+- Summaries are returned in request order, matching the single-ingredient endpoint
+- Repeated IDs get one summary per requested ID
+- Location filter applies to every ingredient
+- Unknown ingredient ID returns 404
+- Single-ingredient summary answers If-None-Match with 304 until stock changes
+"""
+
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.builders import build_ingredient, build_ingredient_batch
+
+
+class TestIngredientBatchSummaries:
+    """Tests for POST /api/v1/batches/ingredient/summaries."""
+
+    def test_summaries_match_single_endpoint_in_request_order(self, client: TestClient, db_session: Session):
+        """
+        Given: Two ingredients with active, depleted and expiring batches
+        When: POST /api/v1/batches/ingredient/summaries with both IDs
+        Then: Each summary equals the single-ingredient summary, in request order
+        """
+        # Arrange
+        cebula = build_ingredient(db_session, name="Cebula")
+        bulki = build_ingredient(db_session, name="Bulki", unit_label="szt")
+        build_ingredient_batch(
+            db_session, ingredient_id=cebula.id, initial_quantity=Decimal("5"),
+            expiry_date=date.today() + timedelta(days=2),
+            created_at=datetime(2024, 3, 1, 8, 0),
+        )
+        build_ingredient_batch(
+            db_session, ingredient_id=cebula.id, initial_quantity=Decimal("3"),
+            expiry_date=date.today() + timedelta(days=30),
+            created_at=datetime(2024, 3, 2, 8, 0),
+        )
+        build_ingredient_batch(
+            db_session, ingredient_id=cebula.id, initial_quantity=Decimal("4"),
+            remaining_quantity=Decimal("0"),
+        )
+        build_ingredient_batch(db_session, ingredient_id=bulki.id, initial_quantity=Decimal("40"))
+
+        # Act
+        response = client.post(
+            "/api/v1/batches/ingredient/summaries",
+            json={"ingredient_ids": [bulki.id, cebula.id]},
+        )
+        single = [
+            client.get(f"/api/v1/batches/ingredient/{i}/summary").json()
+            for i in (bulki.id, cebula.id)
+        ]
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data == single
+        assert [s["ingredient_name"] for s in data] == ["Bulki", "Cebula"]
+        assert data[1]["active_batch_count"] == 2
+        assert data[1]["expiring_soon_count"] == 1
+        assert [b["fifo_order"] for b in data[1]["batches"]] == [1, 2]
+
+    def test_repeated_ids_return_one_summary_each(self, client: TestClient, db_session: Session):
+        """
+        Given: Two ingredients
+        When: POST /api/v1/batches/ingredient/summaries with the first ID twice
+        Then: One summary per requested ID is returned, in request order
+        """
+        # Arrange
+        ser = build_ingredient(db_session, name="Ser")
+        cebula = build_ingredient(db_session, name="Cebula")
+
+        # Act
+        response = client.post(
+            "/api/v1/batches/ingredient/summaries",
+            json={"ingredient_ids": [ser.id, cebula.id, ser.id]},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert [s["ingredient_name"] for s in response.json()] == ["Ser", "Cebula", "Ser"]
+
+    def test_location_filter_applies_to_all_ingredients(self, client: TestClient, db_session: Session):
+        """
+        Given: An ingredient with one storage batch and one shop batch
+        When: POST /api/v1/batches/ingredient/summaries with location=shop
+        Then: Only the shop batch is included
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Ser")
+        build_ingredient_batch(db_session, ingredient_id=ingredient.id, location="storage")
+        shop_batch = build_ingredient_batch(db_session, ingredient_id=ingredient.id, location="shop")
+
+        # Act
+        response = client.post(
+            "/api/v1/batches/ingredient/summaries",
+            json={"ingredient_ids": [ingredient.id], "location": "shop"},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert [b["id"] for b in response.json()[0]["batches"]] == [shop_batch.id]
+
+    def test_unknown_ingredient_returns_404(self, client: TestClient, db_session: Session):
+        """
+        Given: One existing ingredient and one non-existent ID
+        When: POST /api/v1/batches/ingredient/summaries with both IDs
+        Then: 404 is returned
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Pomidor")
+
+        # Act
+        response = client.post(
+            "/api/v1/batches/ingredient/summaries",
+            json={"ingredient_ids": [ingredient.id, 999999]},
+        )
+
+        # Assert
+        assert response.status_code == 404
+
+
+class TestIngredientBatchSummaryEtag:
+    """Tests for conditional GET on /api/v1/batches/ingredient/{id}/summary."""
+
+    def test_summary_returns_304_until_stock_changes(self, client: TestClient, db_session: Session):
+        """
+        Given: A batch summary fetched once with its ETag
+        When: It is requested again with If-None-Match, before and after a new batch arrives
+        Then: The first revalidation is 304 and the second returns the updated summary
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Kapusta")
+        build_ingredient_batch(db_session, ingredient_id=ingredient.id)
+        url = f"/api/v1/batches/ingredient/{ingredient.id}/summary"
+        etag = client.get(url).headers["ETag"]
+
+        # Act
+        unchanged = client.get(url, headers={"If-None-Match": etag})
+        build_ingredient_batch(db_session, ingredient_id=ingredient.id)
+        changed = client.get(url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.json()["active_batch_count"] == 2
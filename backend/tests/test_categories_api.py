@@ -0,0 +1,149 @@
+"""
+Tests for expense category read caching.
+
+Test Scenarios:
+- Repeated tree/leaf reads are served from the cache
+- Creating, updating and deactivating a category through the API
+  invalidates the cached tree and leaf lists
+- Cache is kept separately for active_only=True and active_only=False
+- Read endpoints answer If-None-Match with 304 until the data changes
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from tests.builders import build_expense_category
+
+
+def _build_leaf(db_session: Session, leaf_name: str = "Warzywa"):
+    root = build_expense_category(db_session, name="Koszty operacyjne", level=1)
+    middle = build_expense_category(db_session, name="Skladniki", parent_id=root.id, level=2)
+    leaf = build_expense_category(db_session, name=leaf_name, parent_id=middle.id, level=3)
+    return root, middle, leaf
+
+
+class TestCategoryReadCache:
+    """Tests for caching of category tree and leaf endpoints."""
+
+    def test_tree_is_served_from_cache_until_invalidated(self, client: TestClient, db_session: Session):
+        """
+        Given: A cached category tree
+        When: A category is inserted directly in the database (bypassing the API)
+        Then: The cached tree is still returned
+        """
+        # Arrange
+        build_expense_category(db_session, name="Koszty operacyjne", level=1)
+        first = client.get("/api/v1/categories/tree")
+
+        # Act
+        build_expense_category(db_session, name="Inne", level=1)
+        second = client.get("/api/v1/categories/tree")
+
+        # Assert
+        assert first.status_code == 200
+        assert second.json() == first.json()
+
+    def test_create_invalidates_tree_and_leaves(self, client: TestClient, db_session: Session):
+        """
+        Given: Cached tree and leaf lists
+        When: A new leaf category is created via POST /api/v1/categories
+        Then: Both lists include the new category on the next read
+        """
+        # Arrange
+        _, middle, _ = _build_leaf(db_session)
+        client.get("/api/v1/categories/tree")
+        client.get("/api/v1/categories/leaves")
+
+        # Act
+        response = client.post(
+            "/api/v1/categories",
+            json={"name": "Mieso", "parent_id": middle.id},
+        )
+        tree = client.get("/api/v1/categories/tree").json()
+        leaves = client.get("/api/v1/categories/leaves").json()
+
+        # Assert
+        assert response.status_code == 201
+        assert {c["name"] for c in tree[0]["children"][0]["children"]} == {"Warzywa", "Mieso"}
+        assert [leaf["name"] for leaf in leaves] == ["Mieso", "Warzywa"]
+
+    def test_update_invalidates_leaves(self, client: TestClient, db_session: Session):
+        """
+        Given: A cached leaf list
+        When: A leaf category is renamed via PUT /api/v1/categories/{id}
+        Then: The leaf list returns the new name and full path
+        """
+        # Arrange
+        _, _, leaf = _build_leaf(db_session)
+        client.get("/api/v1/categories/leaves")
+
+        # Act
+        client.put(f"/api/v1/categories/{leaf.id}", json={"name": "Owoce"})
+        leaves = client.get("/api/v1/categories/leaves").json()
+
+        # Assert
+        assert [leaf["full_path"] for leaf in leaves] == ["Koszty operacyjne > Skladniki > Owoce"]
+
+    def test_delete_invalidates_active_and_inactive_views(self, client: TestClient, db_session: Session):
+        """
+        Given: Cached leaf lists for active_only=True and active_only=False
+        When: A leaf category is deactivated via DELETE /api/v1/categories/{id}
+        Then: The active list drops it and the full list shows it as inactive
+        """
+        # Arrange
+        _, _, leaf = _build_leaf(db_session)
+        client.get("/api/v1/categories/leaves")
+        client.get("/api/v1/categories/leaves", params={"active_only": False})
+
+        # Act
+        response = client.delete(f"/api/v1/categories/{leaf.id}")
+        active = client.get("/api/v1/categories/leaves").json()
+        everything = client.get("/api/v1/categories/leaves", params={"active_only": False}).json()
+
+        # Assert
+        assert response.status_code == 204
+        assert active == []
+        assert [(c["name"], c["is_active"]) for c in everything] == [("Warzywa", False)]
+
+
+class TestCategoryEtag:
+    """Tests for conditional GET on category read endpoints."""
+
+    def test_matching_etag_returns_304(self, client: TestClient, db_session: Session):
+        """
+        Given: A category list fetched once with its ETag
+        When: The same list is requested with If-None-Match set to that ETag
+        Then: 304 is returned with no body
+        """
+        # Arrange
+        _build_leaf(db_session)
+        first = client.get("/api/v1/categories")
+        etag = first.headers["ETag"]
+
+        # Act
+        second = client.get("/api/v1/categories", headers={"If-None-Match": etag})
+
+        # Assert
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["ETag"] == etag
+
+    def test_etag_changes_after_write(self, client: TestClient, db_session: Session):
+        """
+        Given: A category tree fetched once with its ETag
+        When: A category is renamed and the tree is requested with the old ETag
+        Then: The full tree is returned with a new ETag
+        """
+        # Arrange
+        root, _, _ = _build_leaf(db_session)
+        etag = client.get("/api/v1/categories/tree").headers["ETag"]
+
+        # Act
+        client.put(f"/api/v1/categories/{root.id}", json={"name": "Koszty stale"})
+        response = client.get("/api/v1/categories/tree", headers={"If-None-Match": etag})
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["name"] == "Koszty stale"
@@ -0,0 +1,406 @@
+"""
+Tests for daily records list pagination.
+
+Test Scenarios:
+- Offset pagination (skip/limit) still returns newest records first
+- cursor_date returns only records older than the cursor
+- Walking pages with cursor_date visits every record exactly once
+- Full pages link to the next page; the last page has no Link header
+- Open day detail splits shop snapshots into opening and closing lists
+- Open day detail eager-loads every relationship it renders (strict loading)
+- Day detail returns 304 for a matching ETag and a new ETag after a change
+- Usage sums mid-day events per ingredient without mixing ingredients
+- Recent days reuse cached closed-day alert counts until the day is edited
+  or a snapshot is posted for it
+- Deleting a day removes its child rows and transactions
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.daily_record import DailyRecord, DayStatus
+from app.models.delivery import Delivery, DeliveryItem
+from app.models.shift_assignment import ShiftAssignment
+from app.models.transaction import Transaction, TransactionType
+from app.models.inventory_snapshot import InventorySnapshot, SnapshotType, InventoryLocation
+from app.schemas.daily_operations import InventorySnapshotItem, EditClosedDayRequest
+from app.services import daily_operations_service
+from app.services.daily_operations_service import calculate_usage
+
+from tests.builders import (
+    build_daily_record,
+    build_delivery,
+    build_ingredient,
+    build_inventory_snapshot,
+    build_shift_assignment,
+    build_spoilage,
+    build_storage_transfer,
+    build_transaction,
+)
+
+
+class TestDailyRecordsListPagination:
+    """Tests for GET /api/v1/daily-records pagination."""
+
+    def _build_days(self, db_session: Session, count: int) -> list[date]:
+        start = date(2024, 3, 1)
+        days = [start + timedelta(days=i) for i in range(count)]
+        for day in days:
+            build_daily_record(db_session, record_date=day, status=DayStatus.CLOSED)
+        return days
+
+    def test_offset_pagination_returns_newest_first(self, client: TestClient, db_session: Session):
+        """
+        Given: Five closed daily records on consecutive days
+        When: GET /api/v1/daily-records with skip=1 and limit=2
+        Then: The second and third newest records are returned
+        """
+        # Arrange
+        days = self._build_days(db_session, 5)
+
+        # Act
+        response = client.get("/api/v1/daily-records", params={"skip": 1, "limit": 2})
+
+        # Assert
+        assert response.status_code == 200
+        returned = [item["date"] for item in response.json()]
+        assert returned == [days[3].isoformat(), days[2].isoformat()]
+
+    def test_cursor_returns_records_older_than_cursor(self, client: TestClient, db_session: Session):
+        """
+        Given: Five closed daily records on consecutive days
+        When: GET /api/v1/daily-records with cursor_date set to the third day
+        Then: Only the two older records are returned, newest first
+        """
+        # Arrange
+        days = self._build_days(db_session, 5)
+
+        # Act
+        response = client.get(
+            "/api/v1/daily-records",
+            params={"cursor_date": days[2].isoformat(), "limit": 10},
+        )
+
+        # Assert
+        assert response.status_code == 200
+        returned = [item["date"] for item in response.json()]
+        assert returned == [days[1].isoformat(), days[0].isoformat()]
+
+    def test_cursor_walk_visits_every_record_once(self, client: TestClient, db_session: Session):
+        """
+        Given: Seven closed daily records on consecutive days
+        When: Paging with limit=3, passing the last date as the next cursor_date
+        Then: All records are returned exactly once in descending order
+        """
+        # Arrange
+        days = self._build_days(db_session, 7)
+        seen: list[str] = []
+        params = {"limit": 3}
+
+        # Act
+        while True:
+            response = client.get("/api/v1/daily-records", params=params)
+            assert response.status_code == 200
+            page = [item["date"] for item in response.json()]
+            if not page:
+                break
+            seen.extend(page)
+            params = {"limit": 3, "cursor_date": page[-1]}
+
+        # Assert
+        assert seen == [day.isoformat() for day in reversed(days)]
+
+    def test_link_header_walks_to_last_page(self, client: TestClient, db_session: Session):
+        """
+        Given: Five closed daily records on consecutive days
+        When: Following the rel="next" Link header starting from limit=2
+        Then: Pages are 2, 2 and 1 records, and the last page has no Link header
+        """
+        # Arrange
+        days = self._build_days(db_session, 5)
+        url = "/api/v1/daily-records/?limit=2"
+
+        # Act
+        page_sizes = []
+        seen = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == 200
+            page_sizes.append(len(response.json()))
+            seen.extend(item["date"] for item in response.json())
+            link = response.headers.get("link")
+            url = link[1:link.index(">")] if link else None
+
+        # Assert
+        assert page_sizes == [2, 2, 1]
+        assert seen == [day.isoformat() for day in reversed(days)]
+
+
+class TestDailyRecordDetail:
+    """Tests for the detail payload of /today and /status/open."""
+
+    def test_open_day_detail_splits_shop_snapshots(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day with opening and closing shop snapshots and a storage snapshot
+        When: GET /api/v1/daily-records/status/open
+        Then: Shop snapshots are split by type and storage snapshots are left out
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Bulki")
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.OPEN)
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.OPEN, quantity=Decimal("20"),
+        )
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.CLOSE, quantity=Decimal("5"),
+        )
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.OPEN, location=InventoryLocation.STORAGE,
+            quantity=Decimal("100"),
+        )
+
+        # Act
+        response = client.get("/api/v1/daily-records/status/open")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["id"] == record.id
+        assert [(s["ingredient_name"], Decimal(s["quantity"])) for s in data["opening_snapshots"]] == [
+            ("Bulki", Decimal("20")),
+        ]
+        assert [Decimal(s["quantity"]) for s in data["closing_snapshots"]] == [Decimal("5")]
+
+    def test_open_day_detail_with_strict_loading(
+        self, client: TestClient, db_session: Session, strict_loading
+    ):
+        """
+        Given: Strict loading is enabled and an open day has snapshots and mid-day events
+        When: GET /api/v1/daily-records/status/open
+        Then: Every rendered relationship is eager-loaded, so the detail renders
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Bulki")
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.OPEN)
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.OPEN, quantity=Decimal("20"),
+        )
+        build_delivery(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        build_storage_transfer(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        build_spoilage(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        db_session.expire_all()
+
+        # Act
+        response = client.get("/api/v1/daily-records/status/open")
+
+        # Assert
+        assert response.status_code == 200
+        events = response.json()["mid_day_events"]
+        assert events["deliveries"][0]["ingredient_name"] == "Bulki"
+        assert events["transfers"][0]["ingredient_name"] == "Bulki"
+        assert events["spoilages"][0]["ingredient_name"] == "Bulki"
+
+    def test_detail_etag_revalidation(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day whose detail the client already fetched
+        When: The detail is requested again with If-None-Match, before and after a new delivery
+        Then: The unchanged detail returns 304, and the changed one returns 200 with a new ETag
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session, name="Bulki")
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.OPEN)
+        url = f"/api/v1/daily-records/{record.id}"
+        etag = client.get(url).headers["etag"]
+
+        # Act
+        unchanged = client.get(url, headers={"If-None-Match": etag})
+        build_delivery(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        changed = client.get(url, headers={"If-None-Match": etag})
+
+        # Assert
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.json()["mid_day_events"]["deliveries_count"] == 1
+
+
+class TestCalculateUsage:
+    """Tests for calculate_usage mid-day event aggregation."""
+
+    def test_usage_sums_events_per_ingredient(self, db_session: Session):
+        """
+        Given: An open day with two ingredients, several deliveries, a transfer and a spoilage
+        When: calculate_usage is called with closing counts
+        Then: Each ingredient gets only its own event totals, and missing events count as zero
+        """
+        # Arrange
+        bulki = build_ingredient(db_session, name="Bulki")
+        mieso = build_ingredient(db_session, name="Mieso")
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.OPEN)
+        for ingredient in (bulki, mieso):
+            build_inventory_snapshot(
+                db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+                snapshot_type=SnapshotType.OPEN, quantity=Decimal("10"),
+            )
+        build_delivery(db_session, daily_record_id=record.id, ingredient_id=bulki.id, quantity=Decimal("5"))
+        build_delivery(db_session, daily_record_id=record.id, ingredient_id=bulki.id, quantity=Decimal("3"))
+        build_storage_transfer(db_session, daily_record_id=record.id, ingredient_id=bulki.id, quantity=Decimal("2"))
+        build_spoilage(db_session, daily_record_id=record.id, ingredient_id=mieso.id, quantity=Decimal("1"))
+
+        # Act
+        items = calculate_usage(db_session, record.id, [
+            InventorySnapshotItem(ingredient_id=bulki.id, quantity=Decimal("4")),
+            InventorySnapshotItem(ingredient_id=mieso.id, quantity=Decimal("6")),
+        ])
+
+        # Assert
+        by_name = {item.ingredient_name: item for item in items}
+        assert (by_name["Bulki"].deliveries, by_name["Bulki"].transfers, by_name["Bulki"].spoilage) == (
+            Decimal("8"), Decimal("2"), Decimal("0"),
+        )
+        assert by_name["Bulki"].usage == Decimal("16")
+        assert (by_name["Mieso"].deliveries, by_name["Mieso"].transfers, by_name["Mieso"].spoilage) == (
+            Decimal("0"), Decimal("0"), Decimal("1"),
+        )
+        assert by_name["Mieso"].usage == Decimal("3")
+
+
+class TestRecentRecordsAlerts:
+    """Tests for closed-day alert counts in GET /api/v1/daily-records/recent."""
+
+    def _build_closed_day(self, db_session: Session, closing: Decimal):
+        ingredient = build_ingredient(db_session, name="Bulki")
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.CLOSED)
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.OPEN, quantity=Decimal("10"),
+        )
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=ingredient.id,
+            snapshot_type=SnapshotType.CLOSE, quantity=closing,
+        )
+        return record, ingredient
+
+    def test_alert_counts_are_cached(self, client: TestClient, db_session: Session, monkeypatch):
+        """
+        Given: A closed day whose closing count is far below the expected one
+        When: GET /api/v1/daily-records/recent is called twice
+        Then: Both responses report one alert, counted only once
+        """
+        # Arrange
+        self._build_closed_day(db_session, closing=Decimal("5"))
+        count_alerts = daily_operations_service._count_closed_day_alerts
+        calls = []
+
+        def counting(db, record_id):
+            calls.append(record_id)
+            return count_alerts(db, record_id)
+
+        monkeypatch.setattr(daily_operations_service, "_count_closed_day_alerts", counting)
+
+        # Act
+        first = client.get("/api/v1/daily-records/recent")
+        second = client.get("/api/v1/daily-records/recent")
+
+        # Assert
+        assert first.json()[0]["alerts_count"] == 1
+        assert second.json()[0]["alerts_count"] == 1
+        assert len(calls) == 1
+
+    def test_edit_closed_day_refreshes_alert_count(self, client: TestClient, db_session: Session):
+        """
+        Given: A closed day with one alert whose count is already cached
+        When: The closing count is corrected to match the expected quantity
+        Then: The recent days list reports no alerts for that day
+        """
+        # Arrange
+        record, ingredient = self._build_closed_day(db_session, closing=Decimal("5"))
+        assert client.get("/api/v1/daily-records/recent").json()[0]["alerts_count"] == 1
+
+        # Act
+        _, error = daily_operations_service.edit_closed_day(db_session, record.id, EditClosedDayRequest(
+            closing_inventory=[InventorySnapshotItem(ingredient_id=ingredient.id, quantity=Decimal("10"))],
+        ))
+
+        # Assert
+        assert error is None
+        assert client.get("/api/v1/daily-records/recent").json()[0]["alerts_count"] == 0
+
+    def test_snapshot_post_refreshes_alert_count(self, client: TestClient, db_session: Session):
+        """
+        Given: A closed day with two alerts whose count is already cached, one
+               of them for an ingredient that has only an opening count
+        When: A closing snapshot matching the opening is posted for that ingredient
+        Then: The recent days list reports one alert for that day
+        """
+        # Arrange
+        record, _ = self._build_closed_day(db_session, closing=Decimal("5"))
+        sauce = build_ingredient(db_session, name="Sos")
+        build_inventory_snapshot(
+            db_session, daily_record_id=record.id, ingredient_id=sauce.id,
+            snapshot_type=SnapshotType.OPEN, quantity=Decimal("10"),
+        )
+        assert client.get("/api/v1/daily-records/recent").json()[0]["alerts_count"] == 2
+
+        # Act
+        response = client.post(
+            f"/api/v1/inventory/snapshot?daily_record_id={record.id}&snapshot_type=close",
+            json={"ingredient_id": sauce.id, "quantity": "10"},
+        )
+
+        # Assert
+        assert response.status_code == 201
+        assert client.get("/api/v1/daily-records/recent").json()[0]["alerts_count"] == 1
+
+
+class TestDeleteDailyRecord:
+    """Tests for DELETE /api/v1/daily-records/{id}."""
+
+    def test_delete_removes_children_and_transactions(self, client: TestClient, db_session: Session):
+        """
+        Given: A day with snapshots, a delivery, a shift and its revenue transaction
+        When: DELETE /api/v1/daily-records/{id}
+        Then: The day and all of its dependent rows are removed
+        """
+        # Arrange
+        ingredient = build_ingredient(db_session)
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.CLOSED)
+        build_inventory_snapshot(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        build_delivery(db_session, daily_record_id=record.id, ingredient_id=ingredient.id)
+        build_shift_assignment(db_session, daily_record_id=record.id)
+        build_transaction(
+            db_session, transaction_type=TransactionType.REVENUE, daily_record_id=record.id,
+        )
+        record_id = record.id
+        db_session.expunge_all()
+
+        # Act
+        response = client.delete(f"/api/v1/daily-records/{record_id}")
+
+        # Assert
+        assert response.status_code == 204
+        assert db_session.query(DailyRecord).count() == 0
+        assert db_session.query(InventorySnapshot).count() == 0
+        assert db_session.query(Delivery).count() == 0
+        assert db_session.query(DeliveryItem).count() == 0
+        assert db_session.query(ShiftAssignment).count() == 0
+        assert db_session.query(Transaction).count() == 0
+
+    def test_delete_missing_record_returns_404(self, client: TestClient):
+        """
+        Given: No daily record with the requested ID
+        When: DELETE /api/v1/daily-records/99999
+        Then: Should return 404
+        """
+        # Act
+        response = client.delete("/api/v1/daily-records/99999")
+
+        # Assert
+        assert response.status_code == 404
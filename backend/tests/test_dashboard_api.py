@@ -0,0 +1,76 @@
+"""
+Tests for the combined dashboard endpoint.
+
+Test Scenarios:
+- /dashboard/all returns the overview together with discrepancy warnings
+- Warnings are calculated once and reused for the overview count
+"""
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.daily_record import DayStatus
+from app.schemas.dashboard import DiscrepancyWarning
+from app.services import dashboard_service
+
+from tests.builders import build_daily_record
+
+
+class TestDashboardData:
+    """Tests for GET /api/v1/dashboard/all."""
+
+    def test_returns_overview_and_warnings(self, client: TestClient, db_session: Session):
+        """
+        Given: Today's day is open and no closed days exist
+        When: GET /api/v1/dashboard/all
+        Then: The overview reports the open day and the warnings list is empty
+        """
+        # Arrange
+        build_daily_record(db_session, record_date=date.today(), status=DayStatus.OPEN)
+
+        # Act
+        response = client.get("/api/v1/dashboard/all")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["overview"]["day_is_open"] is True
+        assert data["overview"]["active_warnings"] == 0
+        assert data["warnings"] == []
+
+    def test_warnings_calculated_once(self, db_session: Session, monkeypatch):
+        """
+        Given: Last week's warnings include one high and one low severity warning
+        When: Building the dashboard data
+        Then: Warnings are calculated once and only the high one counts as active
+        """
+        # Arrange
+        warnings = [
+            DiscrepancyWarning(
+                id=1, date=date.today(), ingredient_id=1, ingredient_name="Bulki",
+                expected_used=10, actual_used=13, discrepancy=3,
+                discrepancy_percent=30, severity="high",
+            ),
+            DiscrepancyWarning(
+                id=2, date=date.today(), ingredient_id=2, ingredient_name="Mieso",
+                expected_used=10, actual_used=10.6, discrepancy=0.6,
+                discrepancy_percent=6, severity="low",
+            ),
+        ]
+        calls = []
+
+        def fake_warnings(db, days_back=7):
+            calls.append(days_back)
+            return warnings
+
+        monkeypatch.setattr(dashboard_service, "get_discrepancy_warnings", fake_warnings)
+
+        # Act
+        result = dashboard_service.get_dashboard_data(db_session)
+
+        # Assert
+        assert calls == [7]
+        assert result.warnings == warnings
+        assert result.overview.active_warnings == 1
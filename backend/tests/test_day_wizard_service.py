@@ -77,6 +77,7 @@ from tests.builders import (
     build_employee,
     build_position,
     build_shift_assignment,
+    build_shift_template,
 )
 
 
@@ -779,6 +780,42 @@ class TestDayWizardServiceSuggestedShifts:
         # Assert
         assert result == []
 
+    def test_get_suggested_shifts_uses_templates_of_active_employees(
+        self, db_session: Session, new_daily_record, sample_employees
+    ):
+        """
+        Given: Monday templates for two active employees and one inactive one,
+               plus a Tuesday template
+        When: Getting suggested shifts for a Monday record
+        Then: Should return only the active employees' Monday shifts,
+              with their position names
+        """
+        # Arrange
+        anna, jan = sample_employees
+        inactive = build_employee(db_session, name="Piotr Zielinski", is_active=False)
+        build_shift_template(db_session, employee=anna, day_of_week=0,
+                             start_time=time(8, 0), end_time=time(16, 0))
+        build_shift_template(db_session, employee=jan, day_of_week=0,
+                             start_time=time(12, 0), end_time=time(20, 0))
+        build_shift_template(db_session, employee=inactive, day_of_week=0)
+        build_shift_template(db_session, employee=anna, day_of_week=1)
+        db_session.commit()
+        service = DayWizardService(db_session)
+
+        # Act
+        result = service.get_suggested_shifts(
+            daily_record_id=new_daily_record.id,
+            target_date=new_daily_record.date
+        )
+
+        # Assert
+        by_employee = {shift.employee_id: shift for shift in result}
+        assert set(by_employee) == {anna.id, jan.id}
+        assert by_employee[anna.id].position_name == "Kucharz"
+        assert by_employee[jan.id].start_time == time(12, 0)
+        assert by_employee[jan.id].end_time == time(20, 0)
+        assert all(shift.source == "template" for shift in result)
+
 
 # =============================================================================
 # INTEGRATION TESTS - API Endpoints
@@ -1085,6 +1122,32 @@ class TestDayWizardAPIGetSalesPreview:
         assert meat_usage is not None
         assert float(meat_usage["used"]) == 30.0
 
+    def test_get_sales_preview_skips_invalid_quantity(
+        self,
+        client: TestClient,
+        db_session: Session,
+        day_with_operations,
+        sample_ingredients
+    ):
+        """
+        Given: A day with operations
+        When: GET sales-preview with a non-numeric closing_inventory value
+        Then: Should ignore that value instead of failing the request
+        """
+        # Arrange
+        meat = sample_ingredients[0]
+
+        # Act
+        response = client.get(
+            f"/api/v1/daily-records/{day_with_operations.id}/sales-preview",
+            params={f"closing_inventory[{meat.id}]": "abc"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        meat_usage = next(i for i in response.json()["ingredients_used"] if i["ingredient_id"] == meat.id)
+        assert meat_usage["closing"] is None
+
     def test_get_sales_preview_not_found(self, client: TestClient, db_session: Session):
         """
         Given: Non-existent daily record ID
@@ -1129,6 +1192,60 @@ class TestDayWizardAPIGetSalesPreview:
         assert len(data["warnings"]) > 0
 
 
+class TestDayWizardAPIPostSalesPreview:
+    """Integration tests for POST /api/v1/daily-records/{id}/sales-preview"""
+
+    def test_post_sales_preview_matches_get(
+        self,
+        client: TestClient,
+        db_session: Session,
+        day_with_operations,
+        sample_ingredients
+    ):
+        """
+        Given: A day with operations
+        When: POST sales-preview with the closing inventory as a JSON body
+        Then: Should return the same usage as the GET variant
+        """
+        # Arrange
+        meat = sample_ingredients[0]
+
+        # Act
+        response = client.post(
+            f"/api/v1/daily-records/{day_with_operations.id}/sales-preview",
+            json={"closing_inventory": {str(meat.id): "38.0"}}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        meat_usage = next(i for i in response.json()["ingredients_used"] if i["ingredient_id"] == meat.id)
+        assert float(meat_usage["used"]) == 30.0
+
+    def test_post_sales_preview_rejects_invalid_quantity(
+        self,
+        client: TestClient,
+        db_session: Session,
+        day_with_operations,
+        sample_ingredients
+    ):
+        """
+        Given: A day with operations
+        When: POST sales-preview with a non-numeric quantity
+        Then: Should return 422 instead of skipping the value
+        """
+        # Arrange
+        meat = sample_ingredients[0]
+
+        # Act
+        response = client.post(
+            f"/api/v1/daily-records/{day_with_operations.id}/sales-preview",
+            json={"closing_inventory": {str(meat.id): "abc"}}
+        )
+
+        # Assert
+        assert response.status_code == 422
+
+
 class TestDayWizardAPIGetSuggestedShifts:
     """
     Integration tests for GET /api/v1/daily-records/{id}/suggested-shifts
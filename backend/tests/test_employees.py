@@ -8,6 +8,7 @@ BDD Scenarios covered:
 - Reactivate an inactive employee
 - Filter employees by active status
 - Cannot delete employee with wage history
+- Employee list eager-loads positions (strict loading)
 
 Service tests (unit) and API tests (integration).
 """
@@ -16,6 +17,7 @@ import pytest
 from decimal import Decimal
 
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
 from app.services import employee_service
@@ -25,6 +27,8 @@ from app.services.employee_service import (
     EmployeeHasHistoryError,
 )
 from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.models.employee import Employee
+from app.core.database import eager_options
 
 from tests.builders import (
     build_position,
@@ -401,6 +405,60 @@ class TestEmployeeServiceGet:
         assert "Jan Aktywny" in names
         assert "Anna Nieaktywna" in names
 
+    def test_get_employees_with_total(self, db_session: Session):
+        """
+        Given: Two active employees and one inactive employee exist
+        When: Getting employees with their total in one query
+        Then: Total matches the returned active employees, sorted by name
+        """
+        # Arrange
+        position = build_position(db_session)
+        build_employee(db_session, name="Piotr Nowak", position=position, is_active=True)
+        build_employee(db_session, name="Jan Aktywny", position=position, is_active=True)
+        build_employee(db_session, name="Anna Nieaktywna", position=position, is_active=False)
+        db_session.commit()
+
+        # Act
+        employees, total = employee_service.get_employees_with_total(db_session)
+
+        # Assert
+        assert total == 2
+        assert [e.name for e in employees] == ["Jan Aktywny", "Piotr Nowak"]
+
+    def test_get_employees_with_total_resolves_effective_rate(self, db_session: Session):
+        """
+        Given: One employee with a custom rate and one using the position rate
+        When: Getting employees with their total
+        Then: Each row carries its position name and effective hourly rate
+        """
+        # Arrange
+        position = build_position(db_session, name="Kucharz", hourly_rate=Decimal("25.00"))
+        build_employee(db_session, name="Anna Nowak", position=position, hourly_rate_override=Decimal("30.00"))
+        build_employee(db_session, name="Jan Kowalski", position=position, hourly_rate_override=None)
+        db_session.commit()
+
+        # Act
+        employees, _ = employee_service.get_employees_with_total(db_session)
+
+        # Assert
+        assert [(e.name, e.position_name, e.hourly_rate) for e in employees] == [
+            ("Anna Nowak", "Kucharz", Decimal("30.00")),
+            ("Jan Kowalski", "Kucharz", Decimal("25.00")),
+        ]
+
+    def test_get_employees_with_total_empty(self, db_session: Session):
+        """
+        Given: No employees exist
+        When: Getting employees with their total
+        Then: Should return an empty list and a zero total
+        """
+        # Act
+        employees, total = employee_service.get_employees_with_total(db_session)
+
+        # Assert
+        assert employees == []
+        assert total == 0
+
     def test_get_employee_by_id(self, db_session: Session):
         """
         Given: An employee exists
@@ -800,3 +858,47 @@ class TestEmployeeEdgeCases:
         # Assert
         assert result.position_id == manager.id
         assert result.effective_hourly_rate == Decimal("35.00")
+
+
+class TestEmployeeStrictLoading:
+    """Tests for the strict loading guard on employee list queries."""
+
+    def test_list_employees_api_with_strict_loading(
+        self, client: TestClient, db_session: Session, strict_loading
+    ):
+        """
+        Given: Strict loading is enabled and employees exist
+        When: GET /api/v1/employees
+        Then: The list renders position names without any lazy loads
+        """
+        # Arrange
+        position = build_position(db_session, name="Kucharz")
+        build_employee(db_session, name="Jan Kowalski", position=position)
+        db_session.commit()
+        db_session.expire_all()
+
+        # Act
+        response = client.get("/api/v1/employees")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["items"][0]["position_name"] == "Kucharz"
+
+    def test_strict_loading_raises_on_lazy_relationship(self, db_session: Session, strict_loading):
+        """
+        Given: Strict loading is enabled
+        When: Accessing a relationship that the query did not eager-load
+        Then: SQLAlchemy raises instead of emitting a hidden SELECT
+        """
+        # Arrange
+        position = build_position(db_session)
+        build_employee(db_session, position=position)
+        db_session.commit()
+        db_session.expire_all()
+
+        # Act
+        employee = db_session.query(Employee).options(*eager_options()).first()
+
+        # Assert
+        with pytest.raises(InvalidRequestError):
+            employee.position
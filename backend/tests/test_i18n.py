@@ -0,0 +1,47 @@
+"""
+Tests for translation keys used by the backend.
+
+Test Scenarios:
+- Every literal key passed to t() exists in each supported language file
+"""
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from app.core.i18n import SUPPORTED_LANGUAGES
+
+
+APP_DIR = Path(__file__).parent.parent / "app"
+# Literal keys only, e.g. t("errors.record_not_found") or t("success.day_updated", date=...)
+T_CALL_KEY = re.compile(r'\bt\(\s*"([a-z_]+\.[a-z0-9_.]+)"')
+
+
+def _used_keys() -> set[str]:
+    keys = set()
+    for path in APP_DIR.rglob("*.py"):
+        keys.update(T_CALL_KEY.findall(path.read_text(encoding="utf-8")))
+    return keys
+
+
+class TestTranslationKeys:
+    """Tests that translation keys used in code are defined."""
+
+    @pytest.mark.parametrize("lang", SUPPORTED_LANGUAGES)
+    def test_used_keys_are_translated(self, lang: str):
+        """
+        Given: All literal keys passed to t() in the app package
+        When: Loading the language file
+        Then: Every key is defined, so no response falls back to the raw key
+        """
+        # Arrange
+        with open(APP_DIR / "i18n" / f"{lang}.json", encoding="utf-8") as f:
+            translations = json.load(f)
+
+        # Act
+        missing = sorted(key for key in _used_keys() if key not in translations)
+
+        # Assert
+        assert missing == []
@@ -0,0 +1,87 @@
+"""
+Tests for the ingredient API endpoints.
+
+Test Scenarios:
+- Ingredient list returns items with numeric stock fields and the total
+- Ingredient list can be filtered by active status
+- Paged ingredient list reports the total of all matching ingredients
+"""
+
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.ingredient import UnitType
+
+from tests.builders import build_ingredient
+
+
+class TestListIngredients:
+    """Tests for GET /api/v1/ingredients."""
+
+    def test_returns_items_and_total(self, client: TestClient, db_session: Session):
+        """
+        Given: A weight ingredient with 12.5 in stock and a count ingredient
+        When: GET /api/v1/ingredients
+        Then: Both are returned with numeric stock values and total 2
+        """
+        # Arrange
+        meat = build_ingredient(db_session, name="Mieso", current_stock_grams=Decimal("12.50"))
+        build_ingredient(
+            db_session, name="Bulki", unit_type=UnitType.COUNT, unit_label="szt", current_stock_count=40
+        )
+
+        # Act
+        response = client.get("/api/v1/ingredients")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 2
+        by_name = {item["name"]: item for item in data["items"]}
+        assert by_name["Mieso"]["id"] == meat.id
+        assert by_name["Mieso"]["unit_type"] == UnitType.WEIGHT.value
+        assert by_name["Mieso"]["current_stock_grams"] == 12.5
+        assert by_name["Bulki"]["current_stock_count"] == 40
+        assert by_name["Bulki"]["unit_label"] == "szt"
+        assert by_name["Bulki"]["is_active"] is True
+
+    def test_filters_by_active_status(self, client: TestClient, db_session: Session):
+        """
+        Given: One active and one inactive ingredient
+        When: GET /api/v1/ingredients?is_active=false
+        Then: Only the inactive ingredient is returned
+        """
+        # Arrange
+        build_ingredient(db_session, name="Ser")
+        build_ingredient(db_session, name="Stary sos", is_active=False)
+
+        # Act
+        response = client.get("/api/v1/ingredients?is_active=false")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert [item["name"] for item in data["items"]] == ["Stary sos"]
+
+    def test_page_reports_total_of_all_matches(self, client: TestClient, db_session: Session):
+        """
+        Given: Three ingredients
+        When: GET /api/v1/ingredients with limit=2, and with skip past the end
+        Then: The page holds two items, and both responses report total 3
+        """
+        # Arrange
+        for name in ("Ser", "Mieso", "Bulki"):
+            build_ingredient(db_session, name=name)
+
+        # Act
+        page = client.get("/api/v1/ingredients?limit=2")
+        past_end = client.get("/api/v1/ingredients?skip=5&limit=2")
+
+        # Assert
+        assert page.status_code == 200
+        assert len(page.json()["items"]) == 2
+        assert page.json()["total"] == 3
+        assert past_end.json() == {"items": [], "total": 3}
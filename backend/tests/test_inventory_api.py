@@ -0,0 +1,235 @@
+"""
+Tests for the inventory snapshot API endpoints.
+
+Test Scenarios:
+- Snapshot list for a day includes ingredient names and legacy quantity fields
+- Snapshot list does not lazy-load relationships
+- Creating a snapshot returns it with ingredient details
+- Current stock lists active ingredients only
+- Discrepancies combine opening/closing snapshots with mid-day events
+- Transfer stock combines storage inventory with the shop's opening plus events
+- Stock levels report active batch counts and the nearest expiry
+"""
+
+from datetime import date
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.ingredient import UnitType
+from app.models.inventory_snapshot import SnapshotType
+from app.models.storage_inventory import StorageInventory
+
+from tests.builders import (
+    build_daily_record,
+    build_delivery,
+    build_ingredient,
+    build_ingredient_batch,
+    build_inventory_snapshot,
+    build_spoilage,
+    build_storage_transfer,
+)
+
+
+class TestGetSnapshotsForDay:
+    """Tests for GET /api/v1/inventory/daily-record/{id}/snapshots."""
+
+    def test_returns_snapshots_with_ingredient_details(self, client: TestClient, db_session: Session):
+        """
+        Given: A day with opening snapshots for a weight and a count ingredient
+        When: GET /api/v1/inventory/daily-record/{id}/snapshots
+        Then: Each snapshot carries its ingredient name and the matching legacy quantity field
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        meat = build_ingredient(db_session, name="Mieso", unit_type=UnitType.WEIGHT)
+        buns = build_ingredient(db_session, name="Bulki", unit_type=UnitType.COUNT, unit_label="szt")
+        build_inventory_snapshot(db_session, record.id, meat.id, quantity=Decimal("12.50"))
+        build_inventory_snapshot(db_session, record.id, buns.id, quantity=Decimal("40"))
+
+        # Act
+        response = client.get(f"/api/v1/inventory/daily-record/{record.id}/snapshots")
+
+        # Assert
+        assert response.status_code == 200
+        by_name = {item["ingredient_name"]: item for item in response.json()}
+        assert set(by_name) == {"Mieso", "Bulki"}
+        assert Decimal(by_name["Mieso"]["quantity"]) == Decimal("12.50")
+        assert Decimal(by_name["Mieso"]["quantity_grams"]) == Decimal("12.50")
+        assert by_name["Mieso"]["quantity_count"] is None
+        assert by_name["Bulki"]["quantity_count"] == 40
+        assert by_name["Bulki"]["quantity_grams"] is None
+        assert by_name["Bulki"]["snapshot_type"] == SnapshotType.OPEN.value
+
+    def test_does_not_lazy_load(self, client: TestClient, db_session: Session, strict_loading):
+        """
+        Given: Strict loading is enabled and a day has a snapshot
+        When: GET /api/v1/inventory/daily-record/{id}/snapshots
+        Then: The ingredient name comes from the projected columns and the request succeeds
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        meat = build_ingredient(db_session, name="Mieso")
+        build_inventory_snapshot(db_session, record.id, meat.id)
+        db_session.expire_all()
+
+        # Act
+        response = client.get(f"/api/v1/inventory/daily-record/{record.id}/snapshots")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()[0]["ingredient_name"] == "Mieso"
+
+
+class TestCreateSnapshot:
+    """Tests for POST /api/v1/inventory/snapshot."""
+
+    def test_returns_created_snapshot(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day and a count ingredient
+        When: POST /api/v1/inventory/snapshot with a closing quantity of 25
+        Then: The created snapshot is returned with its ingredient name and legacy count
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        buns = build_ingredient(db_session, name="Bulki", unit_type=UnitType.COUNT, unit_label="szt")
+
+        # Act
+        response = client.post(
+            f"/api/v1/inventory/snapshot?daily_record_id={record.id}&snapshot_type=close",
+            json={"ingredient_id": buns.id, "quantity": "25"},
+        )
+
+        # Assert
+        assert response.status_code == 201
+        data = response.json()
+        assert data["ingredient_name"] == "Bulki"
+        assert data["snapshot_type"] == SnapshotType.CLOSE.value
+        assert Decimal(data["quantity"]) == Decimal("25")
+        assert data["quantity_count"] == 25
+        assert data["quantity_grams"] is None
+
+
+class TestGetCurrentStock:
+    """Tests for GET /api/v1/inventory/current."""
+
+    def test_lists_active_ingredients_only(self, client: TestClient, db_session: Session):
+        """
+        Given: One active and one inactive ingredient
+        When: GET /api/v1/inventory/current
+        Then: Only the active ingredient is listed
+        """
+        # Arrange
+        active = build_ingredient(db_session, name="Ser")
+        build_ingredient(db_session, name="Stary sos", is_active=False)
+
+        # Act
+        response = client.get("/api/v1/inventory/current")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["ingredient_id"] for item in data] == [active.id]
+        assert data[0]["ingredient_name"] == "Ser"
+
+
+class TestGetDiscrepancies:
+    """Tests for GET /api/v1/inventory/discrepancies/{id}."""
+
+    def test_combines_snapshots_with_mid_day_events(self, client: TestClient, db_session: Session):
+        """
+        Given: Opening 20, delivery 5, transfer 3, spoilage 1 and closing 10 for one ingredient,
+               and an ingredient with only an opening snapshot
+        When: GET /api/v1/inventory/discrepancies/{id}
+        Then: Only the fully counted ingredient is reported, with actual usage 17
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        meat = build_ingredient(db_session, name="Mieso")
+        buns = build_ingredient(db_session, name="Bulki", unit_type=UnitType.COUNT, unit_label="szt")
+        build_inventory_snapshot(db_session, record.id, meat.id, quantity=Decimal("20"))
+        build_inventory_snapshot(
+            db_session, record.id, meat.id, snapshot_type=SnapshotType.CLOSE, quantity=Decimal("10")
+        )
+        build_inventory_snapshot(db_session, record.id, buns.id, quantity=Decimal("40"))
+        build_delivery(db_session, record.id, meat.id, quantity=Decimal("5"))
+        build_storage_transfer(db_session, record.id, meat.id, quantity=Decimal("3"))
+        build_spoilage(db_session, record.id, meat.id, quantity=Decimal("1"))
+
+        # Act
+        response = client.get(f"/api/v1/inventory/discrepancies/{record.id}")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["ingredient_id"] for item in data] == [meat.id]
+        assert Decimal(data[0]["deliveries"]) == Decimal("5")
+        assert Decimal(data[0]["transfers"]) == Decimal("3")
+        assert Decimal(data[0]["spoilage"]) == Decimal("1")
+        assert Decimal(data[0]["actual_used"]) == Decimal("17")
+        assert data[0]["alert_level"] == "ok"
+
+
+class TestGetTransferStock:
+    """Tests for GET /api/v1/inventory/daily-record/{id}/transfer-stock."""
+
+    def test_combines_storage_and_shop_quantities(self, client: TestClient, db_session: Session):
+        """
+        Given: An ingredient with 30 in storage, opening 20 in the shop and a transfer of 4,
+               and an ingredient without any stock
+        When: GET /api/v1/inventory/daily-record/{id}/transfer-stock
+        Then: Shop quantity is 24, storage is 30, and the other ingredient reports zeros
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        meat = build_ingredient(db_session, name="Mieso")
+        buns = build_ingredient(db_session, name="Bulki", unit_type=UnitType.COUNT, unit_label="szt")
+        db_session.add(StorageInventory(ingredient_id=meat.id, quantity=Decimal("30")))
+        build_inventory_snapshot(db_session, record.id, meat.id, quantity=Decimal("20"))
+        build_storage_transfer(db_session, record.id, meat.id, quantity=Decimal("4"))
+        db_session.flush()
+
+        # Act
+        response = client.get(f"/api/v1/inventory/daily-record/{record.id}/transfer-stock")
+
+        # Assert
+        assert response.status_code == 200
+        by_id = {item["ingredient_id"]: item for item in response.json()}
+        assert Decimal(by_id[meat.id]["shop_quantity"]) == Decimal("24")
+        assert Decimal(by_id[meat.id]["storage_quantity"]) == Decimal("30")
+        assert Decimal(by_id[buns.id]["shop_quantity"]) == Decimal("0")
+        assert Decimal(by_id[buns.id]["storage_quantity"]) == Decimal("0")
+
+
+class TestGetStockLevels:
+    """Tests for GET /api/v1/inventory/stock-levels."""
+
+    def test_reports_active_batches_and_nearest_expiry(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day with an opening snapshot, two active batches and
+               one used-up batch for an ingredient
+        When: GET /api/v1/inventory/stock-levels
+        Then: The shop quantity comes from the snapshot, two batches are counted
+              and the nearest expiry is the earlier active one
+        """
+        # Arrange
+        record = build_daily_record(db_session)
+        meat = build_ingredient(db_session, name="Mieso")
+        build_inventory_snapshot(db_session, record.id, meat.id, quantity=Decimal("7"))
+        build_ingredient_batch(db_session, meat.id, expiry_date=date(2026, 3, 10))
+        build_ingredient_batch(db_session, meat.id, expiry_date=None)
+        build_ingredient_batch(
+            db_session, meat.id, expiry_date=date(2026, 3, 1), remaining_quantity=Decimal("0")
+        )
+
+        # Act
+        response = client.get("/api/v1/inventory/stock-levels")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert Decimal(data[0]["shop_qty"]) == Decimal("7")
+        assert data[0]["batches_count"] == 2
+        assert data[0]["nearest_expiry"] == "2026-03-10"
@@ -271,6 +271,28 @@ class TestPositionServiceGet:
         # Assert
         assert count == 2
 
+    def test_get_positions_with_counts(self, db_session: Session):
+        """
+        Given: One position with 2 employees and one without employees
+        When: Getting positions with employee counts
+        Then: Both positions are returned ordered by name with their counts
+        """
+        # Arrange
+        cook = build_position(db_session, name="Kucharz", hourly_rate=Decimal("25.00"))
+        build_position(db_session, name="Kasjer", hourly_rate=Decimal("22.00"))
+        build_employee(db_session, name="Jan Kowalski", position=cook)
+        build_employee(db_session, name="Anna Nowak", position=cook)
+        db_session.commit()
+
+        # Act
+        result = position_service.get_positions_with_counts(db_session)
+
+        # Assert
+        assert [(position.name, count) for position, count in result] == [
+            ("Kasjer", 0),
+            ("Kucharz", 2),
+        ]
+
 
 class TestPositionApiCreate:
     """Integration tests for POST /api/v1/positions"""
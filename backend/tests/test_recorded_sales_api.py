@@ -0,0 +1,114 @@
+"""
+Tests for the recorded sales day total and day checks.
+
+Test Scenarios:
+- Day total sums quantity * unit price across non-voided sales
+- Voided sales are excluded from all totals
+- Day without sales returns zeros
+- Unknown day returns 404; recording a sale on a closed day returns 400
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.daily_record import DayStatus
+
+from tests.builders import (
+    build_daily_record,
+    build_product_variant,
+    build_recorded_sale,
+)
+
+
+class TestDaySalesTotal:
+    """Tests for GET /api/v1/daily-records/{id}/sales/total."""
+
+    def test_total_excludes_voided_sales(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day with two sales and one voided sale
+        When: GET /api/v1/daily-records/{id}/sales/total
+        Then: Totals cover only the non-voided sales
+        """
+        # Arrange
+        record = build_daily_record(db_session, record_date=date(2024, 3, 1), status=DayStatus.OPEN)
+        kebab = build_product_variant(db_session, product_name="Kebab", price_pln=Decimal("24.50"))
+        cola = build_product_variant(db_session, product_name="Cola", price_pln=Decimal("6.99"))
+        build_recorded_sale(
+            db_session, daily_record_id=record.id, product_variant_id=kebab.id,
+            quantity=2, unit_price_pln=Decimal("24.50"),
+        )
+        build_recorded_sale(
+            db_session, daily_record_id=record.id, product_variant_id=cola.id,
+            quantity=3, unit_price_pln=Decimal("6.99"),
+        )
+        build_recorded_sale(
+            db_session, daily_record_id=record.id, product_variant_id=kebab.id,
+            quantity=1, unit_price_pln=Decimal("24.50"), voided_at=datetime(2024, 3, 1, 12, 0),
+        )
+
+        # Act
+        response = client.get(f"/api/v1/daily-records/{record.id}/sales/total")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert Decimal(str(data["total_pln"])) == Decimal("69.97")
+        assert data["sales_count"] == 2
+        assert data["items_count"] == 5
+
+    def test_day_without_sales_returns_zeros(self, client: TestClient, db_session: Session):
+        """
+        Given: An open day with no recorded sales
+        When: GET /api/v1/daily-records/{id}/sales/total
+        Then: All totals are zero
+        """
+        # Arrange
+        record = build_daily_record(db_session, record_date=date(2024, 3, 2), status=DayStatus.OPEN)
+
+        # Act
+        response = client.get(f"/api/v1/daily-records/{record.id}/sales/total")
+
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert Decimal(str(data["total_pln"])) == Decimal("0")
+        assert data["sales_count"] == 0
+        assert data["items_count"] == 0
+
+
+class TestRecordedSalesDayChecks:
+    """Tests for the daily record checks in front of recorded sales endpoints."""
+
+    def test_total_for_missing_day_returns_404(self, client: TestClient):
+        """
+        Given: No daily record with the requested ID
+        When: GET /api/v1/daily-records/99999/sales/total
+        Then: Should return 404
+        """
+        # Act
+        response = client.get("/api/v1/daily-records/99999/sales/total")
+
+        # Assert
+        assert response.status_code == 404
+
+    def test_record_sale_on_closed_day_returns_400(self, client: TestClient, db_session: Session):
+        """
+        Given: A closed day and an active product variant
+        When: POST /api/v1/daily-records/{id}/sales
+        Then: Should return 400 without recording the sale
+        """
+        # Arrange
+        record = build_daily_record(db_session, record_date=date(2024, 3, 3), status=DayStatus.CLOSED)
+        kebab = build_product_variant(db_session, product_name="Kebab")
+
+        # Act
+        response = client.post(
+            f"/api/v1/daily-records/{record.id}/sales",
+            json={"product_variant_id": kebab.id, "quantity": 1},
+        )
+
+        # Assert
+        assert response.status_code == 400
@@ -1,5 +1,10 @@
 import client from './client'
-import type { DashboardOverview, DiscrepancyWarning } from '../types'
+import type { DashboardData, DashboardOverview, DiscrepancyWarning } from '../types'
+
+export async function getDashboardData(): Promise<DashboardData> {
+  const { data } = await client.get('/dashboard/all')
+  return data
+}
 
 export async function getDashboardOverview(): Promise<DashboardOverview> {
   const { data } = await client.get('/dashboard/overview')
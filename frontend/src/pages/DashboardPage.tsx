@@ -1,21 +1,18 @@
 import { useTranslation } from 'react-i18next'
 import { useQuery } from '@tanstack/react-query'
-import { getDashboardOverview, getDiscrepancyWarnings } from '../api/dashboard'
+import { getDashboardData } from '../api/dashboard'
 import { formatCurrency } from '../utils/formatters'
 import { TrendingUp, TrendingDown, Wallet, AlertTriangle } from 'lucide-react'
 import LoadingSpinner from '../components/common/LoadingSpinner'
 
 export default function DashboardPage() {
   const { t } = useTranslation()
-  const { data: overview, isLoading: overviewLoading } = useQuery({
-    queryKey: ['dashboardOverview'],
-    queryFn: getDashboardOverview,
-  })
-
-  const { data: warnings } = useQuery({
-    queryKey: ['discrepancyWarnings'],
-    queryFn: () => getDiscrepancyWarnings(7),
+  const { data, isLoading: overviewLoading } = useQuery({
+    queryKey: ['dashboardData'],
+    queryFn: getDashboardData,
   })
+  const overview = data?.overview
+  const warnings = data?.warnings
 
   if (overviewLoading) {
     return <LoadingSpinner size="lg" />
@@ -327,6 +327,11 @@ export interface DiscrepancyWarning {
   severity: 'low' | 'medium' | 'high'
 }
 
+export interface DashboardData {
+  overview: DashboardOverview
+  warnings: DiscrepancyWarning[]
+}
+
 // Product Variant types
 export interface ProductVariant {
   id: number